@@ -87,18 +87,12 @@ def main():
     # Create encoder
     encoder = MemPackEncoder(config=config)
     
-    # Add texts
-    print("Adding texts to knowledge pack...")
-    for text_data in example_texts:
-        encoder.add_text(text_data["text"], text_data["meta"])
-    
-    print(f"Added {len(encoder.chunks)} chunks")
-    
-    # Build knowledge pack
-    print("\nBuilding knowledge pack...")
+    # Build knowledge pack, streaming texts through chunking and embedding
+    print("Building knowledge pack...")
     stats = encoder.build(
         pack_path="example_kb.mpack",
         ann_path="example_kb.ann",
+        documents=((text_data["text"], text_data["meta"]) for text_data in example_texts),
     )
     
     print(f"\nBuild completed!")
@@ -47,19 +47,19 @@ def main():
             print(f"Query {i}: {query}")
             print("-" * 50)
             
-            # Search
-            hits = retriever.search(query, top_k=3)
+            # Search (columnar results skip per-hit object construction)
+            results = retriever.search_columnar(query, top_k=3)
             
-            if not hits:
+            if not len(results):
                 print("No results found.\n")
                 continue
             
             # Display results
-            for j, hit in enumerate(hits, 1):
-                print(f"{j}. Score: {hit.score:.3f}")
-                print(f"   Source: {hit.meta.get('source', 'unknown')}")
-                print(f"   Topic: {hit.meta.get('topic', 'unknown')}")
-                print(f"   Text: {hit.text[:150]}...")
+            for j, (score, text, meta) in enumerate(zip(results.scores, results.texts, results.metas), 1):
+                print(f"{j}. Score: {score:.3f}")
+                print(f"   Source: {meta.get('source', 'unknown')}")
+                print(f"   Topic: {meta.get('topic', 'unknown')}")
+                print(f"   Text: {text[:150]}...")
                 print()
             
             print()
@@ -71,6 +71,8 @@ def main():
         print(f"  Average search time: {stats.avg_search_ms:.2f}ms")
         print(f"  Cache hits: {stats.cache_hits}")
         print(f"  Cache misses: {stats.cache_misses}")
+        print(f"  Query cache hits: {stats.query_cache_hits}")
+        print(f"  Query cache misses: {stats.query_cache_misses}")
 
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ __author__ = "MemPack Contributors"
 
 # Public API imports
 from .api import MemPackEncoder, MemPackRetriever, MemPackChat
-from .types import SearchHit, ChunkMeta, BuildStats, RetrieverStats
+from .types import SearchHit, SearchResults, ChunkMeta, BuildStats, RetrieverStats
 
 # CLI function
 def cli():
@@ -25,6 +25,7 @@ __all__ = [
     "MemPackRetriever", 
     "MemPackChat",
     "SearchHit",
+    "SearchResults",
     "ChunkMeta",
     "BuildStats",
     "RetrieverStats",
@@ -3,7 +3,7 @@
 from .builder import MemPackEncoder
 from .retriever import MemPackRetriever
 from .chat import MemPackChat
-from .types import SearchHit, ChunkMeta, BuildStats, RetrieverStats
+from .types import SearchHit, SearchResults, ChunkMeta, BuildStats, RetrieverStats
 
 # Re-export main classes
 __all__ = [
@@ -11,6 +11,7 @@ __all__ = [
     "MemPackRetriever",
     "MemPackChat",
     "SearchHit",
+    "SearchResults",
     "ChunkMeta",
     "BuildStats",
     "RetrieverStats",
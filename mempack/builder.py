@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 from tqdm import tqdm
@@ -12,13 +14,20 @@ from tqdm import tqdm
 from .config import MemPackConfig, get_default_config
 from .embedding import EmbeddingBackend, SentenceTransformerBackend
 from .errors import EmbeddingError, IOError, ValidationError
-from .index import HNSWIndex, ANNFile
+from .index import HNSWIndex, QuantizedIndex, ANNFile, normalize_vectors
 from .logging import builder_logger
 from .pack import MemPackWriter
 from .types import Chunk, ChunkMeta, BuildStats
 from .utils import chunk_text, time_ms
 
 
+# Model batches encoded per pipeline step; large enough for parallel HNSW inserts
+PIPELINE_GROUP_BATCHES = 16
+
+# A streamed document: plain text, or a (text, meta) pair
+Document = Union[str, Tuple[str, Optional[Dict[str, Any]]]]
+
+
 class MemPackEncoder:
     """Encoder for building MemPack knowledge packs."""
     
@@ -52,6 +61,8 @@ class MemPackEncoder:
             max_length=self.config.embedding.max_length,
             normalize=self.config.embedding.normalize,
             device=self.config.embedding.device,
+            backend=self.config.embedding.backend,
+            precision=self.config.embedding.precision,
         )
     
     def add_text(
@@ -65,8 +76,24 @@ class MemPackEncoder:
             text: Text content
             meta: Optional metadata
         """
+        self.chunks.extend(self._chunk_document(text, meta))
+    
+    def _chunk_document(
+        self,
+        text: str,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> List[Chunk]:
+        """Split a document into chunks with sequential IDs.
+        
+        Args:
+            text: Text content
+            meta: Optional metadata
+            
+        Returns:
+            Chunks of the document
+        """
         if not text.strip():
-            return
+            return []
         
         # Create chunk metadata
         chunk_meta = ChunkMeta()
@@ -87,6 +114,7 @@ class MemPackEncoder:
         )
         
         # Create chunks
+        chunks = []
         for i, chunk_text_content in enumerate(text_chunks):
             chunk = Chunk(
                 id=self.chunk_id_counter,
@@ -98,10 +126,34 @@ class MemPackEncoder:
             chunk.meta.custom["chunk_index"] = i
             chunk.meta.custom["total_chunks"] = len(text_chunks)
             
-            self.chunks.append(chunk)
+            chunks.append(chunk)
             self.chunk_id_counter += 1
         
         builder_logger.debug(f"Added {len(text_chunks)} chunks from text")
+        
+        return chunks
+    
+    def _stream_chunks(self, documents: Iterable[Document]) -> Iterator[Chunk]:
+        """Lazily chunk a stream of documents.
+        
+        Args:
+            documents: Iterable of texts or (text, meta) pairs
+            
+        Yields:
+            Chunks in document order
+            
+        Raises:
+            ValidationError: If a document has an invalid type
+        """
+        for document in documents:
+            if isinstance(document, str):
+                text, meta = document, None
+            elif isinstance(document, tuple) and len(document) == 2:
+                text, meta = document
+            else:
+                raise ValidationError(f"Invalid document type: {type(document)}", "documents")
+            
+            yield from self._chunk_document(text, meta)
     
     def add_chunks(
         self,
@@ -241,14 +293,19 @@ class MemPackEncoder:
         ann_path: Union[str, Path],
         embed_batch_size: Optional[int] = None,
         workers: Optional[int] = None,
+        documents: Optional[Iterable[Document]] = None,
     ) -> BuildStats:
         """Build the complete MemPack knowledge pack.
         
+        Documents passed via ``documents`` are chunked lazily as the embedding
+        pipeline consumes them, after any chunks added with ``add_text``.
+        
         Args:
             pack_path: Path for the .mpack file
             ann_path: Path for the .ann file
             embed_batch_size: Batch size for embedding generation
             workers: Number of worker threads
+            documents: Optional iterable of texts or (text, meta) pairs to stream in
             
         Returns:
             Build statistics
@@ -257,7 +314,16 @@ class MemPackEncoder:
             ValidationError: If build parameters are invalid
             IOError: If file operations fail
         """
-        if not self.chunks:
+        if documents is not None:
+            if self.embeddings is not None:
+                raise ValidationError("Cannot stream documents into precomputed embeddings", "documents")
+            
+            # Pull the first chunk up front so an empty stream fails like an empty encoder
+            stream = self._stream_chunks(documents)
+            first = next(stream, None)
+            documents = chain([first], stream) if first is not None else None
+        
+        if not self.chunks and documents is None:
             raise ValidationError("No chunks to build", "chunks")
         
         pack_path = Path(pack_path)
@@ -274,16 +340,16 @@ class MemPackEncoder:
         
         try:
             with time_ms() as build_timer:
-                # Generate embeddings if not already done
-                if self.embeddings is None:
-                    self.generate_embeddings(
-                        batch_size=embed_batch_size,
-                        show_progress=self.config.progress,
-                    )
-                
-                # Build HNSW index
+                # Build HNSW index, embedding chunks on the way if not already done
                 with time_ms() as index_timer:
-                    self._build_index()
+                    if self.embeddings is None:
+                        self._embed_and_index(
+                            batch_size=embed_batch_size,
+                            show_progress=self.config.progress,
+                            chunks=documents,
+                        )
+                    else:
+                        self._build_index()
                     index_time_ms = index_timer.elapsed * 1000
                 
                 # Write pack file
@@ -302,7 +368,7 @@ class MemPackEncoder:
                 stats = BuildStats(
                     chunks=len(self.chunks),
                     blocks=0,  # Will be updated by writer
-                    vectors=len(self.embeddings),
+                    vectors=len(self.hnsw_index),
                     bytes_written=pack_path.stat().st_size + ann_path.stat().st_size,
                     build_time_ms=total_time_ms,
                     embedding_time_ms=0,  # Will be updated if we tracked it
@@ -321,25 +387,114 @@ class MemPackEncoder:
                     path.unlink()
             raise IOError(f"Build failed: {e}", str(pack_path))
     
-    def _build_index(self) -> None:
-        """Build the HNSW index."""
+    def _create_index(self) -> Union[HNSWIndex, QuantizedIndex]:
+        """Create an empty index for the configured quantization.
+        
+        Returns:
+            HNSW index, or a flat index when vectors are quantized
+        """
+        if self.config.index.quantization != "none":
+            builder_logger.info(f"Building {self.config.index.quantization} quantized index")
+            
+            return QuantizedIndex(
+                dimensions=self.embedding_backend.dimensions,
+                quantization=self.config.index.quantization,
+                pq_m=self.config.index.pq_m,
+                pq_nbits=self.config.index.pq_nbits,
+            )
+        
         builder_logger.info("Building HNSW index")
         
-        # Create HNSW index
-        self.hnsw_index = HNSWIndex(
+        return HNSWIndex(
             dimensions=self.embedding_backend.dimensions,
-            max_elements=len(self.chunks),
+            max_elements=0,  # Grows as streamed chunks are inserted
             M=self.config.index.hnsw.M,
             ef_construction=self.config.index.hnsw.ef_construction,
             ef_search=self.config.index.hnsw.ef_search,
             allow_replace_deleted=self.config.index.hnsw.allow_replace_deleted,
+            num_threads=self.config.workers or -1,
+            space="ip",  # Embeddings are L2-normalized before insertion
         )
+    
+    def _build_index(self) -> None:
+        """Build the index from precomputed embeddings."""
+        self.hnsw_index = self._create_index()
+        self.embeddings = normalize_vectors(self.embeddings)
         
         # Add vectors to index
         chunk_ids = [chunk.id for chunk in self.chunks]
         self.hnsw_index.add_items(self.embeddings, chunk_ids)
         
-        builder_logger.info(f"HNSW index built with {len(self.hnsw_index)} vectors")
+        builder_logger.info(f"Index built with {len(self.hnsw_index)} vectors")
+    
+    def _embed_and_index(
+        self,
+        batch_size: Optional[int] = None,
+        show_progress: bool = True,
+        chunks: Optional[Iterable[Chunk]] = None,
+    ) -> None:
+        """Embed chunks and build the index in one pipeline.
+        
+        Each group of chunks is inserted into the index on a worker thread
+        while the next group is being encoded, so the encoder and the
+        (GIL-releasing) index inserts run concurrently. Vectors are kept only
+        in the index, so large streams are not held in memory twice.
+        
+        Args:
+            batch_size: Batch size for embedding generation
+            show_progress: Whether to show progress bar
+            chunks: Optional stream of further chunks, appended as they are consumed
+            
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        if batch_size is None:
+            batch_size = self.config.embedding.batch_size
+        
+        self.hnsw_index = self._create_index()
+        group_size = batch_size * PIPELINE_GROUP_BATCHES
+        
+        if chunks is None:
+            builder_logger.info(f"Generating embeddings for {len(self.chunks)} chunks")
+            stream = iter(self.chunks)
+        else:
+            builder_logger.info("Generating embeddings for streamed chunks")
+            stream = chain(list(self.chunks), chunks)
+            self.chunks = []
+        
+        pending = None
+        
+        with ThreadPoolExecutor(max_workers=1) as executor, tqdm(desc="Embedding", unit="chunk", disable=not show_progress) as progress:
+            while True:
+                group = list(islice(stream, group_size))
+                if not group:
+                    break
+                
+                if chunks is not None:
+                    self.chunks.extend(group)
+                
+                try:
+                    result = self.embedding_backend.encode(
+                        texts=[chunk.text for chunk in group],
+                        batch_size=batch_size,
+                        show_progress=False,
+                    )
+                except Exception as e:
+                    raise EmbeddingError(f"Failed to generate embeddings: {e}", self.embedding_backend.model_name)
+                
+                group_embeddings = normalize_vectors(result.embeddings)
+                
+                # Wait for the previous insert before queueing the next one
+                if pending is not None:
+                    pending.result()
+                
+                pending = executor.submit(self.hnsw_index.add_items, group_embeddings, [chunk.id for chunk in group])
+                progress.update(len(group))
+            
+            if pending is not None:
+                pending.result()
+        
+        builder_logger.info(f"Index built with {len(self.hnsw_index)} vectors")
     
     def _write_pack_file(self) -> None:
         """Write the .mpack file."""
@@ -358,7 +513,7 @@ class MemPackEncoder:
         ann_file = ANNFile(self.config.ann_path)
         ann_file.write(
             index=self.hnsw_index,
-            algorithm="hnsw",
+            algorithm="flat" if isinstance(self.hnsw_index, QuantizedIndex) else "hnsw",
             params=self.config.index.hnsw.model_dump(),
         )
         
@@ -370,10 +525,12 @@ class MemPackEncoder:
         Returns:
             Statistics dictionary
         """
+        embedded = self.embeddings is not None or len(getattr(self, "hnsw_index", ())) > 0
+        
         return {
             "chunks": len(self.chunks),
-            "embeddings_generated": self.embeddings is not None,
-            "embedding_dimensions": self.embedding_backend.dimensions if self.embeddings is not None else 0,
+            "embeddings_generated": embedded,
+            "embedding_dimensions": self.embedding_backend.dimensions if embedded else 0,
             "model_name": self.embedding_backend.model_name,
             "model_hash": self.embedding_backend.model_hash,
         }
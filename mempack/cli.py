@@ -43,6 +43,8 @@ def build(
     chunk_overlap: int = typer.Option(50, "--chunk-overlap", help="Chunk overlap in characters"),
     embed_model: str = typer.Option("all-MiniLM-L6-v2", "--embed-model", help="Embedding model"),
     index_type: str = typer.Option("hnsw", "--index", help="Index type (hnsw)"),
+    quantization: str = typer.Option("none", "--quantization", help="Vector quantization (none, int8, binary, pq)"),
+    precision: str = typer.Option("fp32", "--precision", help="Encoder matmul precision (fp32, bf16)"),
     M: int = typer.Option(32, "--M", help="HNSW M parameter"),
     efc: int = typer.Option(200, "--efc", help="HNSW ef_construction parameter"),
     batch_size: int = typer.Option(64, "--batch-size", help="Embedding batch size"),
@@ -66,7 +68,9 @@ def build(
         config.chunking.chunk_overlap = chunk_overlap
         config.embedding.model = embed_model
         config.embedding.batch_size = batch_size
+        config.embedding.precision = precision
         config.index.type = index_type
+        config.index.quantization = quantization
         config.index.hnsw.M = M
         config.index.hnsw.ef_construction = efc
         config.workers = workers
@@ -207,6 +211,7 @@ def verify(
         with MemPackRetriever(
             pack_path=pack_path,
             ann_path=ann_path,
+            warmup=False,  # No queries are embedded
         ) as retriever:
             # Verify
             is_valid = retriever.verify()
@@ -260,6 +265,7 @@ def info(
         with MemPackRetriever(
             pack_path=pack_path,
             ann_path=ann_path,
+            warmup=False,  # No queries are embedded
         ) as retriever:
             # Get information
             pack_stats = retriever.get_pack_stats()
@@ -284,6 +290,7 @@ def info(
             console.print(f"Chunk size: {pack_config.get('chunk_size', 'unknown')}")
             console.print(f"Chunk overlap: {pack_config.get('chunk_overlap', 'unknown')}")
             console.print(f"Compressor: {pack_config.get('compressor', 'unknown')}")
+            console.print(f"Checksum: {pack_config.get('checksum_algorithm', 'xxh3')}")
             console.print()
             
             console.print(f"[bold]File Sizes[/bold]")
@@ -328,6 +335,7 @@ def export(
         with MemPackRetriever(
             pack_path=pack_path,
             ann_path=ann_path,
+            warmup=False,  # No queries are embedded
         ) as retriever:
             # Get all chunks
             chunks = retriever.pack_reader.search_chunks()
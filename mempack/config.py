@@ -28,6 +28,12 @@ class EmbeddingConfig(BaseModel):
     device: Optional[str] = None
     """Device to use (cpu, cuda, auto)."""
     
+    backend: str = Field(default="torch", pattern="^(torch|onnx|onnx-int8)$")
+    """Inference runtime (torch, onnx, onnx-int8)."""
+    
+    precision: str = Field(default="fp32", pattern="^(fp32|bf16)$")
+    """Matmul precision for the torch runtime on CPU (fp32, bf16)."""
+    
     @field_validator('device')
     @classmethod
     def validate_device(cls, v: Optional[str]) -> Optional[str]:
@@ -76,6 +82,9 @@ class CompressionConfig(BaseModel):
     threads: int = Field(default=0, ge=0, le=32)
     """Number of threads for compression (0=auto)."""
     
+    checksum: str = Field(default="xxh3", pattern="^(xxh3|crc32|crc32c)$")
+    """Block checksum algorithm (crc32c requires the crc32c package)."""
+    
     @field_validator('level')
     @classmethod
     def validate_level(cls, v: int, info) -> int:
@@ -153,6 +162,15 @@ class IndexConfig(BaseModel):
     hnsw: Optional[HNSWConfig] = Field(default=None)
     """HNSW-specific configuration."""
     
+    quantization: str = Field(default="none", pattern="^(none|int8|binary|pq)$")
+    """Vector quantization (quantized vectors are searched with a flat index)."""
+    
+    pq_m: int = Field(default=48, ge=1, le=256)
+    """Number of product quantization subquantizers (must divide dimensions)."""
+    
+    pq_nbits: int = Field(default=8, ge=1, le=8)
+    """Bits per product quantization code."""
+    
     def __init__(self, **data):
         super().__init__(**data)
         if self.type == 'hnsw' and self.hnsw is None:
@@ -179,6 +197,15 @@ class RetrieverConfig(BaseModel):
     
     max_results: int = Field(default=1000, ge=1, le=10000)
     """Maximum number of results to return."""
+    
+    query_cache_size: int = Field(default=4096, ge=0, le=1000000)
+    """Number of query embeddings to cache (0=disabled)."""
+    
+    hugepages: bool = False
+    """Whether to keep quantized index codes in huge-page-backed memory."""
+    
+    warmup: bool = True
+    """Whether to warm up the encoder and index when the retriever opens."""
 
 
 class MemPackConfig(BaseModel):
@@ -1,7 +1,7 @@
 """Embedding backends for MemPack."""
 
 from .base import EmbeddingBackend, EmbeddingResult
-from .sentence_tfm import SentenceTransformerBackend
+from .sentence_tfm import SentenceTransformerBackend, clear_model_cache
 from .external import ExternalEmbeddingBackend
 
 __all__ = [
@@ -9,4 +9,5 @@ __all__ = [
     "EmbeddingResult", 
     "SentenceTransformerBackend",
     "ExternalEmbeddingBackend",
+    "clear_model_cache",
 ]
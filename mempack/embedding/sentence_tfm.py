@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
+import os
+import platform
+import threading
 import time
-from typing import List, Optional, Union
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
@@ -14,6 +19,42 @@ from ..errors import EmbeddingError
 from ..logging import embedding_logger
 
 
+# Loaded models shared by every backend in the process (encoder and retriever)
+_MODEL_CACHE: Dict[Tuple, SentenceTransformer] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def clear_model_cache() -> None:
+    """Drop all shared models so their memory can be reclaimed."""
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE.clear()
+
+
+def _onnx_quantization_config() -> str:
+    """Pick the dynamic int8 ONNX quantization preset for the host CPU.
+    
+    Returns:
+        One of arm64, avx2, avx512, avx512_vnni
+    """
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "arm64"
+    
+    # numpy probes the CPU at import; its feature table moved in numpy 2
+    try:
+        from numpy._core._multiarray_umath import __cpu_features__ as features
+    except ImportError:
+        try:
+            from numpy.core._multiarray_umath import __cpu_features__ as features
+        except ImportError:
+            features = {}
+    
+    if features.get("AVX512VNNI"):
+        return "avx512_vnni"
+    if features.get("AVX512F") and features.get("AVX512BW"):
+        return "avx512"
+    return "avx2"
+
+
 class SentenceTransformerBackend(EmbeddingBackend):
     """SentenceTransformers-based embedding backend."""
     
@@ -24,6 +65,9 @@ class SentenceTransformerBackend(EmbeddingBackend):
         normalize: bool = True,
         device: Optional[str] = None,
         cache_folder: Optional[str] = None,
+        backend: str = "torch",
+        intra_op_threads: int = 0,
+        precision: str = "fp32",
     ) -> None:
         """Initialize the SentenceTransformers backend.
         
@@ -31,11 +75,23 @@ class SentenceTransformerBackend(EmbeddingBackend):
             model_name: Name of the SentenceTransformers model
             max_length: Maximum sequence length
             normalize: Whether to normalize embeddings
-            device: Device to use (cpu, cuda, auto)
+            device: Device to use (cpu, cuda, mps, auto; None = SentenceTransformer default)
             cache_folder: Cache folder for models
+            backend: Inference runtime (torch, onnx, onnx-int8)
+            intra_op_threads: ONNX Runtime intra-op threads (0 = runtime default)
+            precision: Matmul precision for the torch runtime on CPU (fp32, bf16)
         """
         super().__init__(model_name, max_length, normalize, device)
+        if backend not in ("torch", "onnx", "onnx-int8"):
+            raise EmbeddingError(f"Unsupported backend: {backend}", model_name)
+        if precision not in ("fp32", "bf16"):
+            raise EmbeddingError(f"Unsupported precision: {precision}", model_name)
+        
         self.cache_folder = cache_folder
+        self.backend = backend
+        self.intra_op_threads = intra_op_threads
+        self.precision = precision
+        self._device = None
         self._model = None
         self._model_hash = None
         self._dimensions = None
@@ -55,25 +111,58 @@ class SentenceTransformerBackend(EmbeddingBackend):
         return self._model_hash
     
     def _load_model(self) -> None:
-        """Load the SentenceTransformers model."""
+        """Load the SentenceTransformers model.
+        
+        Models are shared process-wide, so an encoder and a retriever using
+        the same model load its weights and fast tokenizer only once.
+        """
         if self._model is not None:
             return
         
         try:
-            embedding_logger.info(f"Loading SentenceTransformers model: {self.model_name}")
+            # Let the Rust tokenizer batch-encode in parallel unless the user decided otherwise
+            os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
             
-            # Determine device
+            # Resolve "auto" ourselves; None leaves the choice (CUDA, MPS, CPU) to SentenceTransformer
             device = self.device
             if device == "auto":
                 import torch
                 device = "cuda" if torch.cuda.is_available() else "cpu"
             
-            # Load model
-            self._model = SentenceTransformer(
-                self.model_name,
-                cache_folder=self.cache_folder,
-                device=device,
-            )
+            # ONNX sessions are configured per thread count; torch models are not
+            threads = self.intra_op_threads if self.backend != "torch" else None
+            key = (self.model_name, self.cache_folder, device, self.backend, threads, self.precision)
+            
+            with _MODEL_CACHE_LOCK:
+                self._model = _MODEL_CACHE.get(key)
+                
+                if self._model is None:
+                    embedding_logger.info(f"Loading SentenceTransformers model: {self.model_name}")
+                    
+                    # Load model
+                    if self.backend == "torch":
+                        self._model = SentenceTransformer(
+                            self.model_name,
+                            cache_folder=self.cache_folder,
+                            device=device,
+                        )
+                    else:
+                        self._model = self._load_onnx_model()
+                    
+                    # Share the model with requests for the device it actually landed on
+                    self._device = self._model.device.type
+                    resolved_key = key[:2] + (self._device,) + key[3:]
+                    
+                    if self._use_bf16():
+                        self._optimize_bf16()
+                    
+                    if not getattr(self._model.tokenizer, "is_fast", True):
+                        embedding_logger.warning(f"No fast tokenizer available for {self.model_name}")
+                    
+                    _MODEL_CACHE[key] = self._model
+                    _MODEL_CACHE.setdefault(resolved_key, self._model)
+                else:
+                    self._device = self._model.device.type
             
             # Get dimensions
             self._dimensions = self._model.get_sentence_embedding_dimension()
@@ -86,6 +175,92 @@ class SentenceTransformerBackend(EmbeddingBackend):
         except Exception as e:
             raise EmbeddingError(f"Failed to load model {self.model_name}: {e}", self.model_name)
     
+    def _load_onnx_model(self) -> SentenceTransformer:
+        """Load the model on ONNX Runtime, exporting the int8 variant if needed.
+        
+        The dynamically quantized model is exported once and cached on disk,
+        so subsequent loads skip the export step.
+        
+        Returns:
+            SentenceTransformer model running on ONNX Runtime
+        """
+        import onnxruntime
+        
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = self.intra_op_threads
+        model_kwargs = {
+            "provider": "CPUExecutionProvider",
+            "session_options": session_options,
+        }
+        
+        if self.backend == "onnx":
+            return SentenceTransformer(
+                self.model_name,
+                cache_folder=self.cache_folder,
+                device="cpu",
+                backend="onnx",
+                model_kwargs=model_kwargs,
+            )
+        
+        export_dir = self._get_onnx_export_dir()
+        quantization_config = _onnx_quantization_config()
+        file_name = f"onnx/model_qint8_{quantization_config}.onnx"
+        
+        if not (export_dir / file_name).exists():
+            from sentence_transformers import export_dynamic_quantized_onnx_model
+            
+            embedding_logger.info(f"Exporting int8 ONNX model to {export_dir}")
+            model = SentenceTransformer(
+                self.model_name,
+                cache_folder=self.cache_folder,
+                device="cpu",
+                backend="onnx",
+            )
+            model.save(str(export_dir))
+            export_dynamic_quantized_onnx_model(model, quantization_config, str(export_dir))
+        
+        model_kwargs["file_name"] = file_name
+        return SentenceTransformer(
+            str(export_dir),
+            device="cpu",
+            backend="onnx",
+            model_kwargs=model_kwargs,
+        )
+    
+    def _use_bf16(self) -> bool:
+        """Whether encoding runs under bfloat16 CPU autocast."""
+        return self.precision == "bf16" and self.backend == "torch" and self._device == "cpu"
+    
+    def _optimize_bf16(self) -> None:
+        """Prepare the torch model for bfloat16 CPU inference.
+        
+        Weights stay in float32; autocast lowers only the GEMMs, so layer
+        norms and pooling keep full precision. Intel Extension for PyTorch,
+        when installed, additionally prepacks the weights for AMX/AVX-512.
+        """
+        import torch
+        
+        # Allow bf16 internal precision for any float32 matmuls outside autocast
+        torch.set_float32_matmul_precision("medium")
+        
+        try:
+            import intel_extension_for_pytorch as ipex
+        except ImportError:
+            return
+        
+        self._model.eval()
+        self._model = ipex.optimize(self._model, dtype=torch.bfloat16)
+        embedding_logger.info("Optimized model with Intel Extension for PyTorch (bf16)")
+    
+    def _get_onnx_export_dir(self) -> Path:
+        """Get the directory holding the exported int8 ONNX model.
+        
+        Returns:
+            Export directory path
+        """
+        base_dir = Path(self.cache_folder) if self.cache_folder else Path.home() / ".cache" / "mempack"
+        return base_dir / "onnx" / self.model_name.replace("/", "__")
+    
     def _compute_model_hash(self) -> str:
         """Compute hash of the model for verification."""
         try:
@@ -133,14 +308,15 @@ class SentenceTransformerBackend(EmbeddingBackend):
             
             embedding_logger.debug(f"Encoding {len(texts)} texts with batch_size={batch_size}")
             
-            # Encode texts
-            embeddings = self._model.encode(
-                texts,
-                batch_size=batch_size,
-                show_progress_bar=show_progress,
-                convert_to_numpy=True,
-                normalize_embeddings=self.normalize,
-            )
+            # Encode texts, lowering matmuls to bfloat16 if requested
+            with self._autocast():
+                embeddings = self._model.encode(
+                    texts,
+                    batch_size=batch_size,
+                    show_progress_bar=show_progress,
+                    convert_to_numpy=True,
+                    normalize_embeddings=self.normalize,
+                )
             
             # Ensure float32
             embeddings = embeddings.astype(np.float32)
@@ -163,6 +339,18 @@ class SentenceTransformerBackend(EmbeddingBackend):
         except Exception as e:
             raise EmbeddingError(f"Encoding failed: {e}", self.model_name)
     
+    def _autocast(self):
+        """Get the precision context for a forward pass.
+        
+        Returns:
+            CPU bfloat16 autocast context, or a no-op context for fp32
+        """
+        if not self._use_bf16():
+            return contextlib.nullcontext()
+        
+        import torch
+        return torch.autocast(device_type="cpu", dtype=torch.bfloat16)
+    
     def encode_single(self, text: str) -> np.ndarray:
         """Encode a single text into an embedding.
         
@@ -205,6 +393,8 @@ class SentenceTransformerBackend(EmbeddingBackend):
         info = super().get_model_info()
         info.update({
             "backend": "sentence_transformers",
+            "runtime": self.backend,
+            "precision": self.precision,
             "cache_folder": self.cache_folder,
         })
         return info
@@ -1,10 +1,13 @@
 """Index implementations for MemPack."""
 
-from .hnsw import HNSWIndex
+from .hnsw import HNSWIndex, normalize_vectors
+from .quantized import QuantizedIndex
 from .ann_file import ANNFile, ANNHeader
 
 __all__ = [
     "HNSWIndex",
+    "QuantizedIndex",
     "ANNFile",
     "ANNHeader",
+    "normalize_vectors",
 ]
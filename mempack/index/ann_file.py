@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import mmap
 import os
+import shutil
 import struct
 import tempfile
 from pathlib import Path
@@ -15,9 +16,17 @@ from ..errors import FileFormatError, IOError, IndexError
 from ..logging import index_logger
 from ..types import HNSWParams
 from .hnsw import HNSWIndex
+from .quantized import QuantizedIndex
 from ..pack.spec import ANNHeader, ANN_MAGIC, FORMAT_VERSION, ANN_HEADER_SIZE
 
 
+# Distance space codes stored in the header params
+SPACE_CODES = {
+    "cosine": 0,
+    "ip": 1,
+}
+
+
 class ANNFile:
     """ANN index file reader/writer."""
     
@@ -25,15 +34,18 @@ class ANNFile:
         self,
         file_path: Union[str, Path],
         mmap_enabled: bool = True,
+        hugepages: bool = False,
     ) -> None:
         """Initialize the ANN file.
         
         Args:
             file_path: Path to the .ann file
             mmap_enabled: Whether to use memory mapping
+            hugepages: Load flat index codes into huge-page-backed memory
         """
         self.file_path = Path(file_path)
         self.mmap_enabled = mmap_enabled
+        self.hugepages = hugepages
         
         # File state
         self._file = None
@@ -44,14 +56,14 @@ class ANNFile:
     
     def write(
         self,
-        index: HNSWIndex,
+        index: Union[HNSWIndex, QuantizedIndex],
         algorithm: str = "hnsw",
         params: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Write an index to the ANN file.
         
         Args:
-            index: HNSW index to write
+            index: HNSW or quantized index to write
             algorithm: Algorithm name
             params: Algorithm-specific parameters
             
@@ -65,6 +77,10 @@ class ANNFile:
             # Ensure directory exists
             self.file_path.parent.mkdir(parents=True, exist_ok=True)
             
+            # Record the distance space so the index is reloaded with it
+            params = dict(params or {})
+            params["space"] = getattr(index, "space", "cosine")
+            
             # Create header
             header = ANNHeader(
                 magic=ANN_MAGIC,
@@ -73,7 +89,7 @@ class ANNFile:
                 dimensions=index.dimensions,
                 vector_count=len(index),
                 id_width=4,  # 32-bit IDs
-                params=self._pack_params(params or {}),
+                params=self._pack_params(params),
             )
             
             # Write header
@@ -101,11 +117,11 @@ class ANNFile:
         except Exception as e:
             raise IOError(f"Failed to write ANN file: {e}", str(self.file_path))
     
-    def read(self) -> HNSWIndex:
+    def read(self) -> Union[HNSWIndex, QuantizedIndex]:
         """Read an index from the ANN file.
         
         Returns:
-            HNSW index
+            HNSW index, or quantized index for flat files
             
         Raises:
             FileFormatError: If file format is invalid
@@ -156,13 +172,18 @@ class ANNFile:
         index_logger.debug(f"ANN header: algorithm={self._header.algorithm}, dims={self._header.dimensions}")
     
     def _create_index(self) -> None:
-        """Create HNSW index from header.
+        """Create index from header.
         
         Raises:
             IndexError: If algorithm is unsupported
         """
         algorithm = self._get_algorithm_name(self._header.algorithm)
         
+        if algorithm == "flat":
+            # Quantization type and scale are stored with the index data
+            self._index = QuantizedIndex(dimensions=self._header.dimensions, hugepages=self.hugepages)
+            return
+        
         if algorithm != "hnsw":
             raise IndexError(f"Unsupported algorithm: {algorithm}", algorithm)
         
@@ -177,6 +198,7 @@ class ANNFile:
             ef_construction=params.get("ef_construction", 200),
             ef_search=params.get("ef_search", 64),
             allow_replace_deleted=params.get("allow_replace_deleted", True),
+            space=params.get("space", "cosine"),
         )
     
     def _load_index_data(self) -> None:
@@ -185,19 +207,23 @@ class ANNFile:
         Raises:
             IOError: If loading fails
         """
-        # Read index data (skip header)
+        # Index data follows the header
         offset = ANN_HEADER_SIZE
         
-        if self._mmap:
-            index_data = self._mmap[offset:]
-        else:
-            self._file.seek(offset)
-            index_data = self._file.read()
-        
-        # Save to temporary file and load
+        if isinstance(self._index, QuantizedIndex):
+            if self._mmap:
+                # Zero-copy: codes stay in the mapping and are paged in on use
+                self._index.load_buffer(memoryview(self._mmap)[offset:])
+            else:
+                self._file.seek(offset)
+                self._index.load_buffer(self._file.read())
+            return
+        
+        # hnswlib only loads from a path, so copy the payload into a
+        # temporary file inside the kernel instead of through Python
         with tempfile.NamedTemporaryFile(delete=False) as temp_file:
             temp_path = temp_file.name
-            temp_file.write(index_data)
+            _copy_range(self._file, temp_file, offset)
             temp_file.flush()
             
             try:
@@ -217,6 +243,7 @@ class ANNFile:
         algorithm_map = {
             "hnsw": 0,
             "ivfpq": 1,
+            "flat": 2,
         }
         
         if algorithm not in algorithm_map:
@@ -236,6 +263,7 @@ class ANNFile:
         algorithm_map = {
             0: "hnsw",
             1: "ivfpq",
+            2: "flat",
         }
         
         if algorithm_code not in algorithm_map:
@@ -257,8 +285,9 @@ class ANNFile:
         ef_construction = params.get("ef_construction", 200)
         ef_search = params.get("ef_search", 64)
         allow_replace_deleted = params.get("allow_replace_deleted", True)
+        space = SPACE_CODES[params.get("space", "cosine")]
         
-        return struct.pack('<IIII', M, ef_construction, ef_search, 1 if allow_replace_deleted else 0) + b'\x00' * 16
+        return struct.pack('<IIIII', M, ef_construction, ef_search, 1 if allow_replace_deleted else 0, space) + b'\x00' * 12
     
     def _unpack_params(self, params_data: bytes) -> Dict[str, Any]:
         """Unpack parameters from bytes.
@@ -269,16 +298,22 @@ class ANNFile:
         Returns:
             Parameters dictionary
         """
-        if len(params_data) < 16:
+        if len(params_data) < 20:
             return {}
         
-        M, ef_construction, ef_search, allow_replace_deleted = struct.unpack('<IIII', params_data[:16])
+        M, ef_construction, ef_search, allow_replace_deleted, space = struct.unpack('<IIIII', params_data[:20])
+        
+        # Files written before the space was recorded have zeros here (cosine)
+        space_names = {code: name for name, code in SPACE_CODES.items()}
+        if space not in space_names:
+            raise IndexError(f"Unsupported space code: {space}", "hnsw")
         
         return {
             "M": M,
             "ef_construction": ef_construction,
             "ef_search": ef_search,
             "allow_replace_deleted": bool(allow_replace_deleted),
+            "space": space_names[space],
         }
     
     def get_header(self) -> ANNHeader:
@@ -314,7 +349,12 @@ class ANNFile:
     def close(self) -> None:
         """Close the file and cleanup resources."""
         if self._mmap:
-            self._mmap.close()
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A loaded flat index still views the mapping; it is
+                # unmapped once that index is garbage collected
+                pass
             self._mmap = None
         
         if self._file:
@@ -335,3 +375,39 @@ class ANNFile:
     def __del__(self) -> None:
         """Destructor."""
         self.close()
+
+
+def _copy_range(src, dst, offset: int) -> None:
+    """Copy a file from an offset to its end into another file.
+    
+    Uses copy_file_range or sendfile where available so the data never
+    passes through Python buffers.
+    
+    Args:
+        src: Source file object
+        dst: Destination file object
+        offset: Start offset in the source file
+    """
+    remaining = os.fstat(src.fileno()).st_size - offset
+    dst.flush()
+    
+    for copy in (getattr(os, "copy_file_range", None), getattr(os, "sendfile", None)):
+        if copy is None:
+            continue
+        try:
+            while remaining > 0:
+                if copy is os.sendfile:
+                    copied = os.sendfile(dst.fileno(), src.fileno(), offset, remaining)
+                else:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining, offset)
+                if copied == 0:
+                    break
+                offset += copied
+                remaining -= copied
+            return
+        except OSError:
+            # Not supported for these files; try the next method
+            continue
+    
+    src.seek(offset)
+    shutil.copyfileobj(src, dst)
@@ -26,6 +26,8 @@ class HNSWIndex:
         ef_construction: int = 200,
         ef_search: int = 64,
         allow_replace_deleted: bool = True,
+        num_threads: int = -1,
+        space: str = "cosine",
     ) -> None:
         """Initialize the HNSW index.
         
@@ -36,13 +38,21 @@ class HNSWIndex:
             ef_construction: Size of dynamic candidate list during construction
             ef_search: Size of dynamic candidate list during search
             allow_replace_deleted: Whether to allow replacing deleted elements
+            num_threads: Threads used for inserts and batch queries (-1 = all cores)
+            space: Distance space; "ip" expects L2-normalized vectors and
+                skips the per-distance norm computation of "cosine"
         """
+        if space not in ("cosine", "ip"):
+            raise IndexError(f"Unsupported space: {space}", "hnsw")
+        
         self.dimensions = dimensions
         self.max_elements = max_elements
         self.M = M
         self.ef_construction = ef_construction
         self.ef_search = ef_search
         self.allow_replace_deleted = allow_replace_deleted
+        self.num_threads = num_threads
+        self.space = space
         
         self._index = None
         self._id_to_label = {}
@@ -64,10 +74,17 @@ class HNSWIndex:
         Raises:
             IndexError: If adding items fails
         """
+        n_vectors = vectors.shape[0]
+        
         if self._index is None:
+            # Size the graph exactly for the first batch when not preset
+            if self.max_elements <= 0:
+                self.max_elements = n_vectors
             self._init_index()
-        
-        n_vectors = vectors.shape[0]
+        elif len(self) + n_vectors > self._index.get_max_elements():
+            # Grow geometrically so repeated batches don't reallocate each time
+            self.max_elements = max(len(self) + n_vectors, 2 * self._index.get_max_elements())
+            self._index.resize_index(self.max_elements)
         
         if ids is None:
             ids = list(range(self._next_label, self._next_label + n_vectors))
@@ -90,8 +107,8 @@ class HNSWIndex:
                     self._label_to_id[label] = vector_id
                 labels.append(label)
             
-            # Add to index
-            self._index.add_items(vectors, labels)
+            # Add to index, inserting in parallel
+            self._index.add_items(vectors, np.asarray(labels, dtype=np.uint64), num_threads=self.num_threads)
             self._is_built = True
             
             index_logger.debug(f"Added {n_vectors} vectors to HNSW index")
@@ -170,8 +187,8 @@ class HNSWIndex:
             if ef_search is not None:
                 self._index.set_ef(ef_search)
             
-            # Search
-            labels, distances = self._index.knn_query(query_vectors, k=k)
+            # Search, spreading queries across threads
+            labels, distances = self._index.knn_query(query_vectors, k=k, num_threads=self.num_threads)
             
             # Convert labels to IDs
             ids = np.array([[self._label_to_id[label] for label in query_labels] for query_labels in labels])
@@ -252,6 +269,7 @@ class HNSWIndex:
             "M": self.M,
             "ef_construction": self.ef_construction,
             "ef_search": self.ef_search,
+            "space": self.space,
         }
     
     def save(self, file_path: Union[str, Path]) -> None:
@@ -284,7 +302,7 @@ class HNSWIndex:
         try:
             # Create index without initializing
             self._index = hnswlib.Index(
-                space='cosine',
+                space=self.space,
                 dim=self.dimensions,
             )
             
@@ -318,7 +336,7 @@ class HNSWIndex:
         
         try:
             self._index = hnswlib.Index(
-                space='cosine',
+                space=self.space,
                 dim=self.dimensions,
             )
             
@@ -351,3 +369,19 @@ class HNSWIndex:
     def __repr__(self) -> str:
         """String representation."""
         return f"HNSWIndex(dim={self.dimensions}, elements={len(self)}, built={self._is_built})"
+
+
+def normalize_vectors(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize vectors row-wise, in place when possible.
+    
+    Args:
+        vectors: Array of vectors (shape: [n_vectors, dimensions])
+    
+    Returns:
+        Normalized float32 vectors (the input array if it was float32)
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors /= norms
+    return vectors
@@ -0,0 +1,755 @@
+"""Quantized flat index implementation."""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..errors import IndexError
+from ..logging import index_logger
+
+
+# Blob layout: magic, quantization code, dimensions, vector count, scale
+QUANTIZED_MAGIC = b"MPQI"
+QUANTIZED_HEADER_FORMAT = '<4sIIIf'
+QUANTIZED_HEADER_SIZE = struct.calcsize(QUANTIZED_HEADER_FORMAT)
+
+# PQ blobs follow the header with: subquantizer count, centroids per subquantizer
+PQ_HEADER_FORMAT = '<II'
+PQ_HEADER_SIZE = struct.calcsize(PQ_HEADER_FORMAT)
+
+# Quantization codes
+QUANTIZATION_CODES = {
+    "int8": 1,
+    "binary": 2,
+    "pq": 3,
+}
+
+# PQ codebook training
+PQ_TRAIN_ITERATIONS = 10
+PQ_MAX_TRAIN_POINTS_PER_CENTROID = 32
+
+# Binary search keeps this many candidates per result for int8 reranking
+RESCORE_MULTIPLIER = 4
+
+# Bytes of float32 rows converted per tile, sized to stay resident in L2
+SEARCH_TILE_BYTES = 768 * 1024
+
+# Rows of huge-page-backed codes start on cache-line boundaries
+CACHE_LINE_BYTES = 64
+
+# Transparent huge page size on x86-64 and arm64 Linux
+HUGE_PAGE_BYTES = 2 * 1024 * 1024
+
+# Float32 scratch tile of each searching thread, reused by _int8_dot
+_dot_scratch = threading.local()
+
+# Number of set bits in each 16-bit value (64 KiB, stays cache-resident)
+_POPCOUNT16 = np.array([bin(i).count("1") for i in range(1 << 16)], dtype=np.uint8)
+
+
+class QuantizedIndex:
+    """Exhaustive index over scalar-quantized, L2-normalized vectors.
+    
+    hnswlib can only store float32 vectors, so quantized packs are searched
+    with a flat scan instead. Vectors are quantized with a single global
+    scale (``max(|x|) / 127``), which is near-lossless for normalized
+    embeddings and makes the stored index 4x smaller than float32.
+    With binary quantization the sign bits of the codes are packed 8 per
+    byte; candidates are found by Hamming distance over the packed bits and
+    reranked exactly with the int8 codes. With product quantization each
+    vector is split into ``pq_m`` subvectors that are stored as the index of
+    their nearest k-means centroid (one byte each), and searched with
+    per-query lookup tables. Distances are cosine distances, like the HNSW
+    index.
+    """
+    
+    def __init__(
+        self,
+        dimensions: int,
+        quantization: str = "int8",
+        ef_search: int = 64,
+        pq_m: int = 48,
+        pq_nbits: int = 8,
+        hugepages: bool = False,
+    ) -> None:
+        """Initialize the quantized index.
+        
+        Args:
+            dimensions: Vector dimensions
+            quantization: Quantization type (int8, binary, pq)
+            ef_search: Unused, accepted for compatibility with HNSWIndex
+            pq_m: Number of PQ subquantizers (must divide dimensions)
+            pq_nbits: Bits per PQ code (at most 8)
+            hugepages: Keep codes in huge-page-backed memory with cache-line aligned rows
+        
+        Raises:
+            IndexError: If the quantization type or PQ parameters are unsupported
+        """
+        if quantization not in QUANTIZATION_CODES:
+            raise IndexError(f"Unsupported quantization: {quantization}", "flat")
+        
+        if quantization == "pq" and (dimensions % pq_m != 0 or not 1 <= pq_nbits <= 8):
+            raise IndexError(f"PQ needs pq_m dividing {dimensions} and pq_nbits in 1..8", "flat")
+        
+        self.dimensions = dimensions
+        self.quantization = quantization
+        self.ef_search = ef_search
+        self.pq_m = pq_m
+        self.pq_nbits = pq_nbits
+        self.hugepages = hugepages
+        
+        self._ids = np.empty(0, dtype=np.int64)
+        self._codes = np.empty((0, dimensions), dtype=np.int8)
+        self._bits = np.empty((0, (dimensions + 7) // 8), dtype=np.uint8)
+        self._scale = 1.0
+        self._codebooks: Optional[np.ndarray] = None
+        self._pending: List[np.ndarray] = []
+        self._pending_ids: List[np.ndarray] = []
+        self._is_built = False
+    
+    def add_items(
+        self,
+        vectors: np.ndarray,
+        ids: Optional[List[int]] = None,
+    ) -> None:
+        """Add vectors to the index.
+        
+        Vectors are buffered and quantized on first use, so the scale covers
+        every vector added.
+        
+        Args:
+            vectors: Array of vectors (shape: [n_vectors, dimensions])
+            ids: Optional list of IDs for the vectors
+        
+        Raises:
+            IndexError: If adding items fails
+        """
+        if vectors.ndim != 2 or vectors.shape[1] != self.dimensions:
+            raise IndexError(f"Vectors must have shape [n, {self.dimensions}]", "flat")
+        
+        n_vectors = vectors.shape[0]
+        
+        if ids is None:
+            start = len(self)
+            ids = list(range(start, start + n_vectors))
+        
+        if len(ids) != n_vectors:
+            raise IndexError(f"Number of IDs ({len(ids)}) must match number of vectors ({n_vectors})", "flat")
+        
+        self._pending.append(_normalize(vectors))
+        self._pending_ids.append(np.asarray(ids, dtype=np.int64))
+        self._is_built = True
+        
+        index_logger.debug(f"Added {n_vectors} vectors to quantized index")
+    
+    def _finalize(self) -> None:
+        """Quantize buffered vectors against the existing scale or codebooks.
+        
+        Stored codes are never dequantized and quantized again from scratch:
+        PQ codebooks are trained on the first batch only, and int8 codes are
+        rescaled only when new vectors exceed the current scale.
+        """
+        if not self._pending:
+            return
+        
+        vectors = np.concatenate(self._pending)
+        ids = np.concatenate(self._pending_ids)
+        self._pending.clear()
+        self._pending_ids.clear()
+        
+        if self.quantization == "pq":
+            if not len(self._ids):
+                self._codebooks = _train_pq(vectors, self.pq_m, 1 << self.pq_nbits)
+            codes = _encode_pq(vectors, self._codebooks)
+        else:
+            codes = self._quantize_int8(vectors)
+        
+        if len(self._ids):
+            codes = np.concatenate([self._codes, codes])
+        self._ids = np.concatenate([self._ids, ids])
+        self._set_codes(codes)
+    
+    def _quantize_int8(self, vectors: np.ndarray) -> np.ndarray:
+        """Quantize vectors with the global scale, widening it if needed.
+        
+        If the vectors exceed the current scale, the scale grows to cover
+        them and the stored codes are rescaled in place of a full
+        re-quantization.
+        
+        Args:
+            vectors: Normalized vectors (shape: [n_vectors, dimensions])
+        
+        Returns:
+            int8 codes of the vectors (shape: [n_vectors, dimensions])
+        """
+        max_abs = float(np.abs(vectors).max()) if vectors.size else 0.0
+        
+        if not len(self._ids):
+            self._scale = max_abs / 127.0 if max_abs > 0 else 1.0
+        elif max_abs > self._scale * 127.0:
+            scale = max_abs / 127.0
+            self._codes = np.rint(self._codes * np.float32(self._scale / scale)).astype(np.int8)
+            self._scale = scale
+        
+        return np.clip(np.rint(vectors / self._scale), -127, 127).astype(np.int8)
+    
+    def _set_codes(self, codes: np.ndarray) -> None:
+        """Replace the stored codes, deriving packed sign bits when needed.
+        
+        Args:
+            codes: Quantized codes (shape: [n_vectors, dimensions])
+        """
+        self._codes = _to_hugepages(codes) if self.hugepages else codes
+        if self.quantization == "binary":
+            bits = np.packbits(codes > 0, axis=1)
+            self._bits = _to_hugepages(bits) if self.hugepages else bits
+    
+    def _dequantize(self, codes: np.ndarray) -> np.ndarray:
+        """Convert codes back to float32 vectors.
+        
+        Args:
+            codes: Quantized codes
+        
+        Returns:
+            Approximate float32 vectors
+        """
+        if self.quantization == "pq":
+            # Concatenate the selected centroid of every subquantizer
+            return np.concatenate([self._codebooks[j][codes[..., j]] for j in range(codes.shape[-1])], axis=-1)
+        
+        return codes.astype(np.float32) * np.float32(self._scale)
+    
+    def search(
+        self,
+        query_vector: np.ndarray,
+        k: int = 10,
+        ef_search: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Search for similar vectors.
+        
+        Args:
+            query_vector: Query vector (shape: [dimensions])
+            k: Number of results to return
+            ef_search: Unused, accepted for compatibility with HNSWIndex
+        
+        Returns:
+            Tuple of (distances, ids)
+        
+        Raises:
+            IndexError: If search fails
+        """
+        if query_vector.shape[0] != self.dimensions:
+            raise IndexError(f"Query vector dimension ({query_vector.shape[0]}) must match index dimension ({self.dimensions})", "flat")
+        
+        distances, ids = self.search_batch(query_vector[np.newaxis, :], k=k)
+        return distances[0], ids[0]
+    
+    def search_batch(
+        self,
+        query_vectors: np.ndarray,
+        k: int = 10,
+        ef_search: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Search for similar vectors in batch.
+        
+        Args:
+            query_vectors: Array of query vectors (shape: [n_queries, dimensions])
+            k: Number of results to return per query
+            ef_search: Unused, accepted for compatibility with HNSWIndex
+        
+        Returns:
+            Tuple of (distances, ids) where each has shape [n_queries, k]
+        
+        Raises:
+            IndexError: If search fails
+        """
+        if not self._is_built:
+            raise IndexError("Index not built or empty", "flat")
+        
+        if query_vectors.shape[1] != self.dimensions:
+            raise IndexError(f"Query vector dimension ({query_vectors.shape[1]}) must match index dimension ({self.dimensions})", "flat")
+        
+        try:
+            self._finalize()
+            
+            k = min(k, len(self._ids))
+            queries = _normalize(query_vectors)
+            
+            if self.quantization == "binary":
+                top_sims, top = self._search_binary(queries, k)
+            elif self.quantization == "pq":
+                top_sims, top = _top_k(self._pq_similarities(queries), k)
+            else:
+                top_sims, top = _top_k(self._similarities(queries), k)
+            
+            return (1.0 - top_sims).astype(np.float32), self._ids[top]
+        
+        except Exception as e:
+            raise IndexError(f"Batch search failed: {e}", "flat")
+    
+    def _similarities(self, queries: np.ndarray) -> np.ndarray:
+        """Compute inner products between queries and all stored vectors.
+        
+        Args:
+            queries: Normalized query vectors (shape: [n_queries, dimensions])
+        
+        Returns:
+            Similarity matrix (shape: [n_queries, n_vectors])
+        """
+        # Fold the scale into the queries once instead of into every row
+        scaled = np.ascontiguousarray((queries * np.float32(self._scale)).T)
+        return _int8_dot(self._codes, scaled).T
+    
+    def _pq_similarities(self, queries: np.ndarray) -> np.ndarray:
+        """Compute approximate inner products with asymmetric distance tables.
+        
+        Args:
+            queries: Normalized query vectors (shape: [n_queries, dimensions])
+        
+        Returns:
+            Similarity matrix (shape: [n_queries, n_vectors])
+        """
+        m, ksub, dsub = self._codebooks.shape
+        
+        # Inner product of every query subvector with every centroid
+        tables = np.einsum('qmd,mkd->qmk', queries.reshape(len(queries), m, dsub), self._codebooks)
+        tables = tables.reshape(len(queries), m * ksub)
+        offsets = np.arange(m, dtype=np.intp) * ksub
+        
+        similarities = np.empty((len(queries), len(self._ids)), dtype=np.float32)
+        tile_rows = max(1, SEARCH_TILE_BYTES // (m * 8))
+        
+        for start in range(0, len(self._ids), tile_rows):
+            # Offset the codes so one flat gather reads every subquantizer's table
+            flat = self._codes[start:start + tile_rows].astype(np.intp) + offsets
+            for i in range(len(queries)):
+                similarities[i, start:start + len(flat)] = tables[i][flat].sum(axis=1)
+        
+        return similarities
+    
+    def _search_binary(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Find candidates by Hamming distance and rerank them with int8 codes.
+        
+        Args:
+            queries: Normalized query vectors (shape: [n_queries, dimensions])
+            k: Number of results per query
+        
+        Returns:
+            Tuple of (similarities, row indices), each of shape [n_queries, k]
+        """
+        n_candidates = min(k * RESCORE_MULTIPLIER, len(self._ids))
+        query_bits = np.packbits(queries > 0, axis=1)
+        scaled = queries * np.float32(self._scale)
+        
+        top_sims = np.empty((len(queries), k), dtype=np.float32)
+        top = np.empty((len(queries), k), dtype=np.int64)
+        
+        for i in range(len(queries)):
+            distances = _hamming(self._bits, query_bits[i])
+            candidates = np.argpartition(distances, n_candidates - 1)[:n_candidates]
+            
+            # Exact rerank of the candidates
+            similarities = self._codes[candidates].astype(np.float32) @ scaled[i]
+            sims, order = _top_k(similarities[np.newaxis, :], k)
+            top_sims[i] = sims[0]
+            top[i] = candidates[order[0]]
+        
+        return top_sims, top
+    
+    def get_item(self, vector_id: int) -> Optional[np.ndarray]:
+        """Get a vector by ID.
+        
+        Args:
+            vector_id: Vector ID
+        
+        Returns:
+            Dequantized vector or None if not found
+        """
+        self._finalize()
+        
+        rows = np.flatnonzero(self._ids == vector_id)
+        if len(rows) == 0:
+            return None
+        
+        return self._dequantize(self._codes[rows[0]])
+    
+    def remove_item(self, vector_id: int) -> bool:
+        """Remove a vector by ID.
+        
+        Args:
+            vector_id: Vector ID
+        
+        Returns:
+            True if removed, False if not found
+        """
+        self._finalize()
+        
+        keep = self._ids != vector_id
+        if keep.all():
+            return False
+        
+        self._ids = self._ids[keep]
+        self._set_codes(self._codes[keep])
+        return True
+    
+    def get_stats(self) -> dict:
+        """Get index statistics.
+        
+        Returns:
+            Statistics dictionary
+        """
+        self._finalize()
+        
+        return {
+            "dimensions": self.dimensions,
+            "max_elements": len(self),
+            "current_elements": len(self),
+            "is_built": self._is_built,
+            "quantization": self.quantization,
+            "scale": self._scale,
+            "memory_bytes": (
+                self._codes.nbytes + self._bits.nbytes + self._ids.nbytes
+                + (self._codebooks.nbytes if self._codebooks is not None else 0)
+            ),
+        }
+    
+    def save(self, file_path: Union[str, Path]) -> None:
+        """Save index to file.
+        
+        Args:
+            file_path: Path to save the index
+        
+        Raises:
+            IndexError: If saving fails or an ID does not fit the file's int32 IDs
+        """
+        if not self._is_built:
+            raise IndexError("Index not built or empty", "flat")
+        
+        try:
+            self._finalize()
+            
+            # IDs are stored as int32; refuse to truncate larger ones
+            id_range = np.iinfo(np.int32)
+            if len(self._ids) and (self._ids.min() < id_range.min or self._ids.max() > id_range.max):
+                raise IndexError("Quantized index files store IDs as int32; an ID is out of range", "flat")
+            
+            header = struct.pack(
+                QUANTIZED_HEADER_FORMAT,
+                QUANTIZED_MAGIC,
+                QUANTIZATION_CODES[self.quantization],
+                self.dimensions,
+                len(self._ids),
+                self._scale,
+            )
+            
+            with open(file_path, 'wb') as f:
+                f.write(header)
+                if self.quantization == "pq":
+                    f.write(struct.pack(PQ_HEADER_FORMAT, self._codebooks.shape[0], self._codebooks.shape[1]))
+                    f.write(self._codebooks.astype('<f4').tobytes())
+                f.write(self._ids.astype('<i4').tobytes())
+                f.write(self._codes.tobytes())
+            
+            index_logger.info(f"Quantized index saved to {file_path}")
+        except IndexError:
+            raise
+        except Exception as e:
+            raise IndexError(f"Failed to save quantized index: {e}", "flat")
+    
+    def load(self, file_path: Union[str, Path]) -> None:
+        """Load index from file.
+        
+        Args:
+            file_path: Path to load the index from
+        
+        Raises:
+            IndexError: If loading fails
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except Exception as e:
+            raise IndexError(f"Failed to load quantized index: {e}", "flat")
+        
+        self.load_buffer(data)
+        
+        index_logger.info(f"Quantized index loaded from {file_path}")
+    
+    def load_buffer(self, data: Union[bytes, memoryview]) -> None:
+        """Load index from an in-memory buffer without copying it.
+        
+        The codes stay views of the buffer, so a memory-mapped file is
+        paged in lazily as it is scanned. The buffer must stay open while
+        the index is in use. With hugepages enabled the codes are copied
+        into huge-page-backed memory instead.
+        
+        Args:
+            data: Serialized index (as written by save)
+        
+        Raises:
+            IndexError: If loading fails
+        """
+        try:
+            magic, code, dimensions, count, scale = struct.unpack(
+                QUANTIZED_HEADER_FORMAT, data[:QUANTIZED_HEADER_SIZE]
+            )
+            
+            if magic != QUANTIZED_MAGIC:
+                raise IndexError(f"Invalid quantized index magic: {magic}", "flat")
+            
+            if dimensions != self.dimensions:
+                raise IndexError(f"Index dimension ({dimensions}) does not match header ({self.dimensions})", "flat")
+            
+            names = {value: name for name, value in QUANTIZATION_CODES.items()}
+            if code not in names:
+                raise IndexError(f"Unsupported quantization code: {code}", "flat")
+            
+            offset = QUANTIZED_HEADER_SIZE
+            code_width = dimensions
+            code_dtype = np.int8
+            codebooks = None
+            
+            if names[code] == "pq":
+                m, ksub = struct.unpack(PQ_HEADER_FORMAT, data[offset:offset + PQ_HEADER_SIZE])
+                offset += PQ_HEADER_SIZE
+                codebooks = np.frombuffer(data, dtype='<f4', count=m * ksub * (dimensions // m), offset=offset)
+                codebooks = codebooks.reshape(m, ksub, dimensions // m)
+                offset += codebooks.nbytes
+                code_width = m
+                code_dtype = np.uint8
+            
+            ids = np.frombuffer(data, dtype='<i4', count=count, offset=offset)
+            offset += ids.nbytes
+            codes = np.frombuffer(data, dtype=code_dtype, count=count * code_width, offset=offset)
+            
+            self.quantization = names[code]
+            self._scale = scale
+            self._codebooks = codebooks
+            if codebooks is not None:
+                self.pq_m = codebooks.shape[0]
+            self._ids = ids.astype(np.int64)
+            self._set_codes(codes.reshape(count, code_width))
+            self._pending.clear()
+            self._pending_ids.clear()
+            self._is_built = True
+        
+        except IndexError:
+            raise
+        except Exception as e:
+            raise IndexError(f"Failed to load quantized index: {e}", "flat")
+    
+    def clear(self) -> None:
+        """Clear the index."""
+        self._ids = np.empty(0, dtype=np.int64)
+        self._codes = np.empty((0, self.dimensions), dtype=np.int8)
+        self._bits = np.empty((0, (self.dimensions + 7) // 8), dtype=np.uint8)
+        self._scale = 1.0
+        self._codebooks = None
+        self._pending.clear()
+        self._pending_ids.clear()
+        self._is_built = False
+    
+    def __len__(self) -> int:
+        """Get number of elements in the index."""
+        return len(self._ids) + sum(len(ids) for ids in self._pending_ids)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"QuantizedIndex(dim={self.dimensions}, quantization={self.quantization}, elements={len(self)}, built={self._is_built})"
+
+
+def _to_hugepages(rows: np.ndarray) -> np.ndarray:
+    """Copy a 2-D array into huge-page-backed memory with cache-line aligned rows.
+    
+    Rows are padded to a multiple of the cache line so no vector straddles
+    an extra line, and the mapping asks for transparent huge pages so a
+    scan over the codes needs far fewer TLB entries. Platforms without
+    anonymous mappings get the array back unchanged.
+    
+    Args:
+        rows: Array to copy (shape: [n_rows, width])
+        
+    Returns:
+        Row-aligned view of the copy (shape: [n_rows, width])
+    """
+    if not hasattr(mmap, "MAP_ANONYMOUS") or rows.size == 0:
+        return rows
+    
+    n_rows, width = rows.shape
+    stride = -(-width * rows.itemsize // CACHE_LINE_BYTES) * CACHE_LINE_BYTES
+    size = -(-n_rows * stride // HUGE_PAGE_BYTES) * HUGE_PAGE_BYTES
+    
+    # The mapping is page-aligned, so every padded row starts on a cache line
+    buffer = mmap.mmap(-1, size, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+    if hasattr(mmap, "MADV_HUGEPAGE"):
+        buffer.madvise(mmap.MADV_HUGEPAGE)
+    
+    padded = np.frombuffer(buffer, dtype=rows.dtype, count=n_rows * stride // rows.itemsize)
+    aligned = padded.reshape(n_rows, stride // rows.itemsize)[:, :width]
+    aligned[...] = rows
+    return aligned
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize vectors row-wise.
+    
+    Args:
+        vectors: Array of vectors (shape: [n_vectors, dimensions])
+    
+    Returns:
+        Normalized float32 copy of the vectors
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _int8_dot(codes: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """Multiply int8 codes with float32 queries, one cache-sized tile at a time.
+    
+    Each tile of codes is widened into a per-thread float32 scratch tile
+    and multiplied with BLAS, which picks the best SIMD kernel for the CPU.
+    Converting the whole matrix at once would stream it through memory twice.
+    
+    Args:
+        codes: Quantized codes (shape: [n_vectors, dimensions])
+        queries: Query matrix (shape: [dimensions, n_queries])
+    
+    Returns:
+        Products (shape: [n_vectors, n_queries])
+    """
+    n_vectors, dimensions = codes.shape
+    tile_rows = max(1, SEARCH_TILE_BYTES // (dimensions * 4))
+    
+    scratch = getattr(_dot_scratch, "tile", None)
+    if scratch is None or scratch.shape != (tile_rows, dimensions):
+        scratch = _dot_scratch.tile = np.empty((tile_rows, dimensions), dtype=np.float32)
+    
+    out = np.empty((n_vectors, queries.shape[1]), dtype=np.float32)
+    for start in range(0, n_vectors, tile_rows):
+        block = codes[start:start + tile_rows]
+        tile = scratch[:len(block)]
+        np.copyto(tile, block, casting='unsafe')
+        np.dot(tile, queries, out=out[start:start + len(block)])
+    
+    return out
+
+
+def _train_pq(vectors: np.ndarray, m: int, ksub: int, seed: int = 0) -> np.ndarray:
+    """Train product quantization codebooks with k-means per subspace.
+    
+    Args:
+        vectors: Training vectors (shape: [n_vectors, dimensions])
+        m: Number of subquantizers
+        ksub: Centroids per subquantizer (capped at the number of vectors)
+        seed: Random seed for sampling and initialization
+        
+    Returns:
+        Codebooks (shape: [m, ksub, dimensions // m])
+    """
+    rng = np.random.default_rng(seed)
+    ksub = max(1, min(ksub, len(vectors)))
+    dsub = vectors.shape[1] // m
+    
+    # Train on a sample; more points per centroid adds little accuracy
+    max_points = ksub * PQ_MAX_TRAIN_POINTS_PER_CENTROID
+    if len(vectors) > max_points:
+        vectors = vectors[rng.choice(len(vectors), max_points, replace=False)]
+    
+    codebooks = np.empty((m, ksub, dsub), dtype=np.float32)
+    for j in range(m):
+        sub = np.ascontiguousarray(vectors[:, j * dsub:(j + 1) * dsub])
+        centroids = sub[rng.choice(len(sub), ksub, replace=False)].copy()
+        
+        for _ in range(PQ_TRAIN_ITERATIONS):
+            assignment = _nearest_centroids(sub, centroids)
+            counts = np.bincount(assignment, minlength=ksub)
+            sums = np.stack([np.bincount(assignment, weights=sub[:, d], minlength=ksub) for d in range(dsub)], axis=1)
+            
+            # Reseed empty clusters from random points
+            empty = counts == 0
+            centroids[~empty] = sums[~empty] / counts[~empty, np.newaxis]
+            if empty.any():
+                centroids[empty] = sub[rng.choice(len(sub), int(empty.sum()))]
+        
+        codebooks[j] = centroids
+    
+    return codebooks
+
+
+def _encode_pq(vectors: np.ndarray, codebooks: np.ndarray) -> np.ndarray:
+    """Encode vectors as the nearest centroid of each subquantizer.
+    
+    Args:
+        vectors: Vectors (shape: [n_vectors, dimensions])
+        codebooks: Codebooks (shape: [m, ksub, dsub])
+        
+    Returns:
+        Codes (shape: [n_vectors, m])
+    """
+    m, _, dsub = codebooks.shape
+    codes = np.empty((len(vectors), m), dtype=np.uint8)
+    for j in range(m):
+        codes[:, j] = _nearest_centroids(vectors[:, j * dsub:(j + 1) * dsub], codebooks[j])
+    return codes
+
+
+def _nearest_centroids(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Find the nearest centroid (L2) of each point.
+    
+    Args:
+        points: Points (shape: [n_points, dsub])
+        centroids: Centroids (shape: [ksub, dsub])
+        
+    Returns:
+        Centroid indices (shape: [n_points])
+    """
+    # ||c||^2 - 2 p.c, dropping ||p||^2, which doesn't change the argmin
+    distances = np.dot(points, centroids.T)
+    distances *= -2.0
+    distances += (centroids * centroids).sum(axis=1)
+    return distances.argmin(axis=1)
+
+
+def _top_k(similarities: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Select the k most similar columns of each row, in descending order.
+    
+    Args:
+        similarities: Similarity matrix (shape: [n_queries, n_vectors])
+        k: Number of results per row
+    
+    Returns:
+        Tuple of (similarities, column indices), each of shape [n_queries, k]
+    """
+    # Partial sort for the top-k, then order those by similarity
+    top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+    top_sims = np.take_along_axis(similarities, top, axis=1)
+    order = np.argsort(-top_sims, axis=1)
+    return np.take_along_axis(top_sims, order, axis=1), np.take_along_axis(top, order, axis=1)
+
+
+def _hamming(bits: np.ndarray, query_bits: np.ndarray) -> np.ndarray:
+    """Compute Hamming distances between packed bit rows and a query.
+    
+    Args:
+        bits: Packed bits (shape: [n_vectors, n_bytes])
+        query_bits: Packed query bits (shape: [n_bytes])
+    
+    Returns:
+        Hamming distances (shape: [n_vectors])
+    """
+    xor = np.bitwise_xor(bits, query_bits)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(xor).sum(axis=1, dtype=np.int32)
+    
+    # Look up 16 bits at a time, padding rows to an even number of bytes
+    if xor.shape[1] % 2:
+        xor = np.pad(xor, ((0, 0), (0, 1)))
+    return _POPCOUNT16[xor.view(np.uint16)].sum(axis=1, dtype=np.int32)
@@ -3,7 +3,7 @@
 from .spec import PackSpec, FileHeader, SectionOffsets
 from .writer import MemPackWriter
 from .reader import MemPackReader
-from .toc import TableOfContents, ChunkInfo, BlockInfo
+from .toc import TableOfContents, ChunkInfo, BlockInfo, MetadataIndex
 
 __all__ = [
     "PackSpec",
@@ -14,4 +14,5 @@ __all__ = [
     "TableOfContents",
     "ChunkInfo",
     "BlockInfo",
+    "MetadataIndex",
 ]
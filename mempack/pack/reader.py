@@ -12,11 +12,15 @@ import cbor2
 from ..errors import FileFormatError, IOError, ValidationError, CorruptBlockError
 from ..logging import pack_logger
 from ..types import Chunk, ChunkMeta
-from ..utils import compute_xxh3, verify_checksum
+from ..utils import compute_block_checksum, hash_blocks_parallel, verify_checksum
+from ..utils.hash import XXH3_BACKEND
 from .spec import MPACK_HEADER_SIZE
 from .spec import FileHeader, PackSpec, MPACK_MAGIC, FORMAT_VERSION
 from .toc import TableOfContents, ChunkInfo, BlockInfo
 
+# Blocks decompressed per parallel hashing round in verify() (16 MiB of 64 KiB blocks)
+VERIFY_BATCH_BLOCKS = 256
+
 
 class BlockCache:
     """LRU cache for decompressed blocks."""
@@ -98,6 +102,7 @@ class MemPackReader:
         # File state
         self._file = None
         self._mmap = None
+        self._view = None
         self._header = None
         self._config = None
         self._toc = None
@@ -122,6 +127,7 @@ class MemPackReader:
             
             if self.mmap_enabled:
                 self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._mmap)
             
             # Read and parse header
             self._read_header()
@@ -147,11 +153,7 @@ class MemPackReader:
         Raises:
             FileFormatError: If header is invalid
         """
-        if self._mmap:
-            header_data = self._mmap[:MPACK_HEADER_SIZE]
-        else:
-            self._file.seek(0)
-            header_data = self._file.read(MPACK_HEADER_SIZE)
+        header_data = self._read_range(0, MPACK_HEADER_SIZE)
         
         self._header = FileHeader.unpack(header_data)
         self._header.validate()
@@ -167,11 +169,7 @@ class MemPackReader:
         offset = self._header.section_offsets.config_offset
         length = self._header.section_offsets.config_length
         
-        if self._mmap:
-            config_data = self._mmap[offset:offset + length]
-        else:
-            self._file.seek(offset)
-            config_data = self._file.read(length)
+        config_data = self._read_range(offset, length)
         
         try:
             self._config = cbor2.loads(config_data)
@@ -203,12 +201,7 @@ class MemPackReader:
         offset = self._header.section_offsets.toc_offset
         length = self._header.section_offsets.toc_length
         
-        if self._mmap:
-            toc_data = self._mmap[offset:offset + length]
-        else:
-            self._file.seek(offset)
-            toc_data = self._file.read(length)
-        
+        toc_data = self._read_range(offset, length)
         
         try:
             self._toc = TableOfContents.deserialize(toc_data)
@@ -236,6 +229,25 @@ class MemPackReader:
             except Exception as e2:
                 raise FileFormatError(f"Failed to parse TOC: {e}, decompress: {e2}")
     
+    def _read_range(self, offset: int, length: int) -> Union[bytes, memoryview]:
+        """Read a byte range of the file.
+        
+        With memory mapping the range is a zero-copy view of the mapping;
+        callers must not keep it beyond the current operation.
+        
+        Args:
+            offset: Start offset
+            length: Number of bytes
+            
+        Returns:
+            File data
+        """
+        if self._view is not None:
+            return self._view[offset:offset + length]
+        
+        self._file.seek(offset)
+        return self._file.read(length)
+    
     def _init_decompressor(self) -> None:
         """Initialize the decompressor."""
         compressor = self._config.get("compressor", "zstd")
@@ -273,15 +285,63 @@ class MemPackReader:
         if block_info is None:
             raise IOError(f"Block {block_id} not found")
         
+        decompressed_data = self._load_block(block_info)
+        
+        # Verify checksum (uncompressed blocks are hashed in place); packs
+        # written before the algorithm was recorded use XXH3
+        algorithm = self._checksum_algorithm()
+        if not verify_checksum(decompressed_data, block_info.checksum, algorithm):
+            raise CorruptBlockError(
+                block_id, block_info.checksum, compute_block_checksum(decompressed_data, algorithm)
+            )
+        
+        # Copy uncompressed blocks out of the mapping so cached blocks don't pin it
+        if isinstance(decompressed_data, memoryview):
+            decompressed_data = bytes(decompressed_data)
+        
+        # Cache the block
+        self.block_cache.put(block_id, decompressed_data)
+        
+        return decompressed_data
+    
+    def _checksum_algorithm(self) -> str:
+        """Get the block checksum algorithm (XXH3 for packs that predate the setting).
+        
+        Raises:
+            ValidationError: If the pack's XXH3 checksums came from another backend
+        """
+        algorithm = self._config.get("checksum_algorithm", "xxh3")
+        
+        # Packs that predate the setting are assumed to match the running backend
+        backend = self._config.get("xxh3_backend", XXH3_BACKEND)
+        if algorithm == "xxh3" and backend != XXH3_BACKEND:
+            raise ValidationError(
+                f"Pack checksums were written with the {backend} XXH3 backend, "
+                f"but this installation uses {XXH3_BACKEND}",
+                "checksum_algorithm",
+            )
+        
+        return algorithm
+    
+    def _load_block(self, block_info: BlockInfo) -> Union[bytes, memoryview]:
+        """Read and decompress a block without verifying it.
+        
+        Args:
+            block_info: Block to load
+            
+        Returns:
+            Decompressed block data (a view of the mapping if uncompressed)
+            
+        Raises:
+            IOError: If block cannot be decompressed
+        """
+        block_id = block_info.id
+        
         # Read compressed data
         offset = self._header.section_offsets.blocks_offset + block_info.offset
         length = block_info.compressed_size
         
-        if self._mmap:
-            compressed_data = self._mmap[offset:offset + length]
-        else:
-            self._file.seek(offset)
-            compressed_data = self._file.read(length)
+        compressed_data = self._read_range(offset, length)
         
         # Decompress
         if self._compressor is None:
@@ -297,13 +357,6 @@ class MemPackReader:
             except Exception as e:
                 raise IOError(f"Decompression failed for block {block_id}: {e}")
         
-        # Verify checksum
-        if not verify_checksum(decompressed_data, block_info.checksum, "xxh3"):
-            raise CorruptBlockError(block_id, block_info.checksum, compute_xxh3(decompressed_data))
-        
-        # Cache the block
-        self.block_cache.put(block_id, decompressed_data)
-        
         return decompressed_data
     
     def get_chunk(self, chunk_id: int) -> Optional[Chunk]:
@@ -322,9 +375,9 @@ class MemPackReader:
         # Read block
         block_data = self._read_block(chunk_info.block_id)
         
-        # Extract chunk data
-        chunk_data = block_data[chunk_info.offset:chunk_info.offset + chunk_info.length]
-        text = chunk_data.decode('utf-8')
+        # Decode chunk text straight from the block, without an intermediate copy
+        chunk_data = memoryview(block_data)[chunk_info.offset:chunk_info.offset + chunk_info.length]
+        text = str(chunk_data, 'utf-8')
         
         # Create chunk metadata
         meta = ChunkMeta(**chunk_info.meta)
@@ -425,16 +478,29 @@ class MemPackReader:
         
         Returns:
             True if file is valid
+            
+        Raises:
+            ValidationError: If the pack's checksums cannot be computed here
         """
+        # Checked outside the try so a backend mismatch is not reported as corruption
+        algorithm = self._checksum_algorithm()
+        
         try:
             # Verify header
             self._header.validate()
             
-            # Verify all blocks
-            for block_info in self._toc.blocks:
-                try:
-                    self._read_block(block_info.id)
-                except CorruptBlockError:
+            # Verify all blocks, decompressing a batch at a time and hashing
+            # batches large enough to split on the shared thread pool
+            blocks = self._toc.blocks
+            for start in range(0, len(blocks), VERIFY_BATCH_BLOCKS):
+                batch = blocks[start:start + VERIFY_BATCH_BLOCKS]
+                checksums = hash_blocks_parallel(
+                    [self._load_block(block_info) for block_info in batch], algorithm
+                )
+                if any(
+                    checksum != block_info.checksum
+                    for block_info, checksum in zip(batch, checksums, strict=True)
+                ):
                     return False
             
             return True
@@ -444,8 +510,17 @@ class MemPackReader:
     
     def close(self) -> None:
         """Close the file and cleanup resources."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        
         if self._mmap:
-            self._mmap.close()
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A view is still referenced (e.g. by a traceback); the
+                # mapping is unmapped once it is garbage collected
+                pass
             self._mmap = None
         
         if self._file:
@@ -189,7 +189,7 @@ class ANNHeader:
     
     magic: bytes = ANN_MAGIC
     version: int = FORMAT_VERSION
-    algorithm: int = 0  # 0=HNSW, 1=IVFPQ
+    algorithm: int = 0  # 0=HNSW, 1=IVFPQ, 2=flat (quantized)
     dimensions: int = 0
     vector_count: int = 0
     id_width: int = 4
@@ -265,7 +265,7 @@ class ANNHeader:
         if self.version != FORMAT_VERSION:
             raise FileFormatError(f"Unsupported ANN version: {self.version}")
         
-        if self.algorithm not in [0, 1]:
+        if self.algorithm not in [0, 1, 2]:
             raise FileFormatError(f"Unsupported algorithm: {self.algorithm}")
         
         if self.dimensions <= 0:
@@ -378,6 +378,7 @@ class PackSpec:
         algorithm_map = {
             0: "hnsw",
             1: "ivfpq",
+            2: "flat",
         }
         
         if algorithm not in algorithm_map:
@@ -401,6 +402,7 @@ class PackSpec:
         algorithm_map = {
             "hnsw": 0,
             "ivfpq": 1,
+            "flat": 2,
         }
         
         if algorithm not in algorithm_map:
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import cbor2
+import numpy as np
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..errors import FileFormatError
 
@@ -70,7 +71,7 @@ class BlockInfo:
     """Last chunk ID in this block"""
     
     checksum: int
-    """XXH3 checksum of uncompressed data"""
+    """Checksum of uncompressed data (algorithm recorded in the pack config)"""
     
     offset: int
     """Offset in the pack file"""
@@ -141,6 +142,88 @@ class TagsIndex:
         return cls(tags=data.get("tags", {}))
 
 
+class MetadataIndex:
+    """Dictionary-encoded chunk metadata for vectorized filtering.
+    
+    Every metadata field becomes a column of an int32 matrix of value codes
+    (-1 where a chunk lacks the field), so a filter is a handful of integer
+    comparisons over the candidate rows instead of a dict comparison per chunk.
+    """
+    
+    def __init__(self, chunks: List[ChunkInfo]) -> None:
+        """Encode the metadata of the given chunks.
+        
+        Args:
+            chunks: Chunk information
+        """
+        self.fields: Dict[str, int] = {}
+        self.values: List[Dict[Any, int]] = []
+        
+        for chunk in chunks:
+            for key in chunk.meta:
+                if key not in self.fields:
+                    self.fields[key] = len(self.fields)
+                    self.values.append({})
+        
+        codes = np.full((len(chunks), len(self.fields)), -1, dtype=np.int32)
+        for row, chunk in enumerate(chunks):
+            for key, value in chunk.meta.items():
+                column = self.fields[key]
+                table = self.values[column]
+                codes[row, column] = table.setdefault(_freeze(value), len(table))
+        
+        # Rows sorted by chunk ID so candidates are located with a binary search
+        ids = np.array([chunk.id for chunk in chunks], dtype=np.int64)
+        order = np.argsort(ids, kind="stable")
+        self.chunk_ids = ids[order]
+        self.codes = codes[order]
+    
+    def match(self, chunk_ids: np.ndarray, meta_filter: Dict[str, Any]) -> np.ndarray:
+        """Check which chunks match a metadata filter.
+        
+        Args:
+            chunk_ids: Candidate chunk IDs
+            meta_filter: Metadata filter (field name to required value)
+            
+        Returns:
+            Boolean mask over the candidates
+        """
+        chunk_ids = np.asarray(chunk_ids, dtype=np.int64)
+        if len(self.chunk_ids) == 0:
+            return np.zeros(len(chunk_ids), dtype=bool)
+        
+        rows = np.minimum(np.searchsorted(self.chunk_ids, chunk_ids), len(self.chunk_ids) - 1)
+        keep = self.chunk_ids[rows] == chunk_ids
+        
+        for key, value in meta_filter.items():
+            column = self.fields.get(key)
+            code = None if column is None else self.values[column].get(_freeze(value))
+            if code is None:
+                # Field or value never occurs, so nothing can match
+                return np.zeros(len(chunk_ids), dtype=bool)
+            keep &= self.codes[rows, column] == code
+        
+        return keep
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a metadata value into a hashable key with the same equality.
+    
+    Args:
+        value: Metadata value
+        
+    Returns:
+        Hashable representation of the value
+    """
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    if isinstance(value, dict):
+        return (dict, frozenset((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, tuple):
+        return (tuple, tuple(_freeze(item) for item in value))
+    return value
+
+
 @dataclass
 class TableOfContents:
     """Table of Contents for a MemPack file."""
@@ -154,6 +237,31 @@ class TableOfContents:
     tags_index: Optional[TagsIndex] = None
     """Optional tags index"""
     
+    _chunk_positions: Dict[int, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    """Chunk ID to position in ``chunks`` (rebuilt when ``chunks`` grows)"""
+    
+    _block_positions: Dict[int, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    """Block ID to position in ``blocks`` (rebuilt when ``blocks`` grows)"""
+    
+    _indexed_counts: Tuple[int, int] = field(default=(-1, -1), init=False, repr=False, compare=False)
+    """Lengths of ``chunks`` and ``blocks`` when the positions were built"""
+    
+    def _refresh_positions(self) -> None:
+        """Rebuild the ID lookups if chunks or blocks changed since last use."""
+        if self._indexed_counts == (len(self.chunks), len(self.blocks)):
+            return
+        
+        # setdefault keeps the first entry for an ID, like a linear scan would
+        self._chunk_positions = {}
+        for position, chunk in enumerate(self.chunks):
+            self._chunk_positions.setdefault(chunk.id, position)
+        
+        self._block_positions = {}
+        for position, block in enumerate(self.blocks):
+            self._block_positions.setdefault(block.id, position)
+        
+        self._indexed_counts = (len(self.chunks), len(self.blocks))
+    
     def add_chunk(self, chunk: ChunkInfo) -> None:
         """Add a chunk to the TOC.
         
@@ -179,10 +287,9 @@ class TableOfContents:
         Returns:
             Chunk information or None
         """
-        for chunk in self.chunks:
-            if chunk.id == chunk_id:
-                return chunk
-        return None
+        self._refresh_positions()
+        position = self._chunk_positions.get(chunk_id)
+        return None if position is None else self.chunks[position]
     
     def get_block(self, block_id: int) -> Optional[BlockInfo]:
         """Get block information by ID.
@@ -193,10 +300,9 @@ class TableOfContents:
         Returns:
             Block information or None
         """
-        for block in self.blocks:
-            if block.id == block_id:
-                return block
-        return None
+        self._refresh_positions()
+        position = self._block_positions.get(block_id)
+        return None if position is None else self.blocks[position]
     
     def get_chunks_in_block(self, block_id: int) -> List[ChunkInfo]:
         """Get all chunks in a block.
@@ -221,7 +327,7 @@ class TableOfContents:
         if self.tags_index is None:
             return []
         
-        chunk_ids = self.tags_index.get_chunks_by_tag(tag)
+        chunk_ids = set(self.tags_index.get_chunks_by_tag(tag))
         return [chunk for chunk in self.chunks if chunk.id in chunk_ids]
     
     def get_chunks_by_meta(self, meta_filter: Dict[str, Any]) -> List[ChunkInfo]:
@@ -14,7 +14,8 @@ from ..config import MemPackConfig
 from ..errors import CompressionError, IOError, ValidationError
 from ..logging import pack_logger
 from ..types import Chunk, ChunkMeta, PackConfig
-from ..utils import atomic_write, compute_xxh3, align_offset
+from ..utils import atomic_writev, compute_block_checksum, align_offset
+from ..utils.hash import XXH3_BACKEND
 from .spec import PackSpec, FileHeader, SectionOffsets, MPACK_HEADER_SIZE, FORMAT_VERSION, MPACK_MAGIC
 from .toc import TableOfContents, ChunkInfo, BlockInfo, TagsIndex
 
@@ -116,26 +117,26 @@ class MemPackWriter:
         pack_logger.info("Creating compressed blocks")
         
         block_size = 64 * 1024  # 64KB blocks
-        current_block = b""
+        current_block = bytearray()
         current_chunks = []
         block_id = 0
         
         for chunk in self.chunks:
             # Serialize chunk data
-            chunk_data = chunk.text.encode('utf-8')
+            chunk_data = chunk.text if isinstance(chunk.text, bytes) else chunk.text.encode('utf-8')
             chunk_header = f"{chunk.id}:{len(chunk_data)}:".encode('utf-8')
-            chunk_payload = chunk_header + chunk_data
             
             # Check if chunk fits in current block
-            if len(current_block) + len(chunk_payload) > block_size and current_block:
+            if len(current_block) + len(chunk_header) + len(chunk_data) > block_size and current_block:
                 # Finalize current block
                 self._finalize_block(current_block, current_chunks, block_id)
                 block_id += 1
-                current_block = b""
+                current_block = bytearray()
                 current_chunks = []
             
-            # Add chunk to current block
-            current_block += chunk_payload
+            # Append chunk to current block in place
+            current_block += chunk_header
+            current_block += chunk_data
             current_chunks.append(chunk)
         
         # Finalize last block
@@ -151,7 +152,7 @@ class MemPackWriter:
     
     def _finalize_block(
         self,
-        block_data: bytes,
+        block_data: bytearray,
         chunks: List[Chunk],
         block_id: int,
     ) -> None:
@@ -166,7 +167,7 @@ class MemPackWriter:
         compressed_data = self._compress_data(block_data)
         
         # Compute checksum
-        checksum = compute_xxh3(block_data)
+        checksum = compute_block_checksum(block_data, self.config.compression.checksum)
         
         # Store block
         self.blocks.append(compressed_data)
@@ -225,12 +226,18 @@ class MemPackWriter:
         config_data = {
             "version": self.config.version,
             "compressor": self.config.compression.algorithm,
+            "checksum_algorithm": self.config.compression.checksum,
+            "xxh3_backend": XXH3_BACKEND,  # xxhash and BLAKE2b checksums differ
             "chunk_size": self.config.chunking.chunk_size,
             "chunk_overlap": self.config.chunking.chunk_overlap,
             "embedding_model": self.config.embedding.model,
             "embedding_dim": self.config.embedding.dimensions,
+            "embedding_backend": self.config.embedding.backend,
+            "embedding_precision": self.config.embedding.precision,
             "index_type": self.config.index.type,
             "index_params": self.config.index.hnsw.model_dump() if self.config.index.hnsw else {},
+            "index_quantization": self.config.index.quantization,
+            "normalized": True,  # The encoder L2-normalizes all embeddings
             "ecc_enabled": self.config.ecc.enabled,
             "ecc_params": self.config.ecc.model_dump() if self.config.ecc.enabled else None,
         }
@@ -245,13 +252,16 @@ class MemPackWriter:
         """
         return self.toc.serialize()
     
-    def _write_blocks(self) -> bytes:
+    def _write_blocks(self) -> List[bytes]:
         """Write compressed blocks.
         
+        The blocks are stored back to back; they are returned as separate
+        segments so the file writer can emit them without joining.
+        
         Returns:
-            Blocks bytes
+            Compressed blocks in order
         """
-        return b''.join(self.blocks)
+        return list(self.blocks)
     
     def _write_checksums(self) -> bytes:
         """Write checksums.
@@ -302,7 +312,8 @@ class MemPackWriter:
             # Write sections
             config_data = self._write_config()
             toc_data = self._write_toc()
-            blocks_data = self._write_blocks()
+            blocks = self._write_blocks()
+            blocks_length = sum(len(block) for block in blocks)
             checksums_data = self._write_checksums()
             tags_index_data = self._write_tags_index()
             ecc_data = self._write_ecc()
@@ -317,7 +328,7 @@ class MemPackWriter:
             offset = PackSpec.align_offset(offset + len(toc_data))
             
             blocks_offset = offset
-            offset = PackSpec.align_offset(offset + len(blocks_data))
+            offset = PackSpec.align_offset(offset + blocks_length)
             
             checksums_offset = offset
             offset = PackSpec.align_offset(offset + len(checksums_data))
@@ -333,7 +344,7 @@ class MemPackWriter:
                 toc_offset=toc_offset,
                 toc_length=len(toc_data),
                 blocks_offset=blocks_offset,
-                blocks_length=len(blocks_data),
+                blocks_length=blocks_length,
                 checksums_offset=checksums_offset,
                 checksums_length=len(checksums_data),
                 tags_index_offset=tags_index_offset,
@@ -355,29 +366,29 @@ class MemPackWriter:
                 section_offsets=section_offsets,
             )
             
-            # Write file data with proper alignment and padding
-            file_data = (
-                header.pack() +
-                b'\x00' * (config_offset - MPACK_HEADER_SIZE) +
-                config_data +
-                b'\x00' * (toc_offset - config_offset - len(config_data)) +
-                toc_data +
-                b'\x00' * (blocks_offset - toc_offset - len(toc_data)) +
-                blocks_data +
-                b'\x00' * (checksums_offset - blocks_offset - len(blocks_data)) +
-                checksums_data +
-                b'\x00' * (tags_index_offset - checksums_offset - len(checksums_data)) +
-                tags_index_data +
-                b'\x00' * (ecc_offset - tags_index_offset - len(tags_index_data)) +
-                ecc_data
-            )
-            
-            # File data is already constructed above
+            # Lay out the sections with alignment padding; they are written
+            # in one writev call instead of being concatenated first
+            segments = [
+                header.pack(),
+                b'\x00' * (config_offset - MPACK_HEADER_SIZE),
+                config_data,
+                b'\x00' * (toc_offset - config_offset - len(config_data)),
+                toc_data,
+                b'\x00' * (blocks_offset - toc_offset - len(toc_data)),
+                *blocks,
+                b'\x00' * (checksums_offset - blocks_offset - blocks_length),
+                checksums_data,
+                b'\x00' * (tags_index_offset - checksums_offset - len(checksums_data)),
+                tags_index_data,
+                b'\x00' * (ecc_offset - tags_index_offset - len(tags_index_data)),
+                ecc_data,
+            ]
+            file_size = sum(len(segment) for segment in segments)
             
             # Debug: verify the data is being written correctly
-            pack_logger.debug(f"File data lengths: header={len(header.pack())}, config={len(config_data)}, toc={len(toc_data)}, blocks={len(blocks_data)}")
+            pack_logger.debug(f"File data lengths: header={len(header.pack())}, config={len(config_data)}, toc={len(toc_data)}, blocks={blocks_length}")
             pack_logger.debug(f"TOC data first 50 bytes: {toc_data[:50]}")
-            pack_logger.debug(f"Blocks data first 50 bytes: {blocks_data[:50]}")
+            pack_logger.debug(f"Blocks data first 50 bytes: {blocks[0][:50] if blocks else b''}")
             
             # Verify TOC data is CBOR
             try:
@@ -392,14 +403,10 @@ class MemPackWriter:
                 
             
             # Atomic write
-            atomic_write(self.pack_path, file_data)
-            
-            # Verify what was actually written
-            with open(self.pack_path, 'rb') as f:
-                written_data = f.read()
+            atomic_writev(self.pack_path, segments)
             
             pack_logger.info(f"MemPack file written: {self.pack_path}")
-            pack_logger.info(f"Total size: {len(file_data)} bytes")
+            pack_logger.info(f"Total size: {file_size} bytes")
             pack_logger.info(f"Chunks: {len(self.chunks)}")
             pack_logger.info(f"Blocks: {len(self.blocks)}")
             
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from tqdm import tqdm
@@ -11,11 +13,11 @@ from tqdm import tqdm
 from .config import MemPackConfig, get_default_config
 from .embedding import EmbeddingBackend, SentenceTransformerBackend
 from .errors import EmbeddingError, IOError, ValidationError
-from .index import ANNFile, HNSWIndex
+from .index import ANNFile, HNSWIndex, normalize_vectors
 from .logging import retriever_logger
-from .pack import MemPackReader
-from .types import SearchHit, RetrieverStats
-from .utils import time_ms
+from .pack import MemPackReader, MetadataIndex
+from .types import SearchHit, SearchResults, RetrieverStats
+from .utils import compute_xxh3, time_ms
 
 
 class MemPackRetriever:
@@ -31,6 +33,9 @@ class MemPackRetriever:
         io_batch_size: int = 64,
         ef_search: int = 64,
         prefetch: bool = True,
+        query_cache_size: int = 4096,
+        hugepages: bool = False,
+        warmup: bool = True,
     ) -> None:
         """Initialize the retriever.
         
@@ -43,6 +48,9 @@ class MemPackRetriever:
             io_batch_size: Batch size for I/O operations
             ef_search: HNSW search parameter
             prefetch: Whether to prefetch blocks
+            query_cache_size: Number of query embeddings to cache (0 = disabled)
+            hugepages: Keep quantized index codes in huge-page-backed memory
+            warmup: Run a dummy encode and search so the first query is not slow
         """
         self.pack_path = Path(pack_path)
         self.ann_path = Path(ann_path)
@@ -51,26 +59,67 @@ class MemPackRetriever:
         self.io_batch_size = io_batch_size
         self.ef_search = ef_search
         self.prefetch = prefetch
+        self.query_cache_size = query_cache_size
+        self.hugepages = hugepages
         
-        # Initialize embedding backend
-        self.embedding_backend = embedding_backend or self._create_default_embedding_backend()
+        # LRU cache of query embeddings keyed by (model name, query)
+        self._query_cache: OrderedDict[Tuple[str, str], np.ndarray] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        
+        # Encoded chunk metadata for filtering (built on first filtered search)
+        self._meta_index: Optional[MetadataIndex] = None
+        
+        # Embedding backend (the default one is created once the pack config is known)
+        self.embedding_backend = embedding_backend
         
         # Load files
         self._load_files()
         
         # Statistics
-        self.stats = RetrieverStats()
+        self.stats = RetrieverStats(hash_backend=compute_xxh3.backend)
+        
+        if warmup:
+            self._warmup()
+    
+    def _warmup(self) -> None:
+        """Load the model and run one batch through the encoder and the index.
+        
+        This moves lazy model loading and the one-off kernel setup of the
+        first forward pass out of the first query. The query cache and
+        statistics are left untouched.
+        """
+        try:
+            with time_ms() as warmup_timer:
+                self.embedding_backend.encode(["warmup"] * self.io_batch_size, batch_size=self.io_batch_size)
+                
+                if len(self.hnsw_index):
+                    dummy = np.zeros((1, self.embedding_backend.dimensions), dtype=np.float32)
+                    dummy[0, 0] = 1.0
+                    self.hnsw_index.search_batch(dummy, k=1, ef_search=self.ef_search)
+            
+            retriever_logger.debug(f"Warmup took {warmup_timer.elapsed * 1000:.2f}ms")
+            
+        except Exception as e:
+            retriever_logger.warning(f"Warmup failed: {e}")
     
     def _create_default_embedding_backend(self) -> EmbeddingBackend:
         """Create the default embedding backend.
         
+        The model and inference runtime are taken from the pack configuration
+        so queries are embedded the same way the chunks were.
+        
         Returns:
             Default embedding backend
         """
+        pack_config = self.pack_reader.get_config()
+        
         return SentenceTransformerBackend(
-            model_name="all-MiniLM-L6-v2",  # Default model
+            model_name=pack_config.get("embedding_model", "all-MiniLM-L6-v2"),
             max_length=512,
             normalize=True,
+            backend=pack_config.get("embedding_backend", "torch"),
+            precision=pack_config.get("embedding_precision", "fp32"),
+            intra_op_threads=1,  # Single queries are latency-bound
         )
     
     def _load_files(self) -> None:
@@ -88,9 +137,12 @@ class MemPackRetriever:
             )
             
             # Load ANN file
-            self.ann_file = ANNFile(self.ann_path, mmap_enabled=self.mmap)
+            self.ann_file = ANNFile(self.ann_path, mmap_enabled=self.mmap, hugepages=self.hugepages)
             self.hnsw_index = self.ann_file.read()
             
+            if self.embedding_backend is None:
+                self.embedding_backend = self._create_default_embedding_backend()
+            
             # Verify compatibility
             self._verify_compatibility()
             
@@ -143,64 +195,58 @@ class MemPackRetriever:
         Returns:
             List of search hits
             
+        Raises:
+            EmbeddingError: If query embedding fails
+            ValidationError: If parameters are invalid
+        """
+        return self.search_columnar(query, top_k, filter_meta, ef_search).to_hits()
+    
+    def search_columnar(
+        self,
+        query: str,
+        top_k: int = 5,
+        filter_meta: Optional[Dict[str, Any]] = None,
+        ef_search: Optional[int] = None,
+    ) -> SearchResults:
+        """Search for similar chunks, returning columnar results.
+        
+        Unlike search(), no SearchHit objects are created unless the
+        results are indexed or iterated.
+        
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            filter_meta: Optional metadata filter
+            ef_search: HNSW search parameter
+            
+        Returns:
+            Search results sorted by score (descending)
+            
         Raises:
             EmbeddingError: If query embedding fails
             ValidationError: If parameters are invalid
         """
         if not query.strip():
-            return []
+            return SearchResults.empty()
         
         if top_k <= 0:
             raise ValidationError("top_k must be positive", "top_k")
         
         try:
             with time_ms() as search_timer:
-                # Generate query embedding
-                query_embedding = self.embedding_backend.encode_single(query)
-                
-                # Search HNSW index
-                distances, chunk_ids = self.hnsw_index.search(
-                    query_vector=query_embedding,
-                    k=min(top_k, len(self.hnsw_index)),
-                    ef_search=ef_search or self.ef_search,
-                )
-                
-                # Get chunks
-                chunks = self.pack_reader.get_chunks(list(chunk_ids))
-                
-                # Apply metadata filter
-                if filter_meta:
-                    chunks = self._filter_chunks_by_meta(chunks, filter_meta)
-                
-                # Create search hits
-                hits = []
-                for i, chunk in enumerate(chunks):
-                    if chunk is not None:
-                        # Convert distance to similarity score (higher is better)
-                        score = 1.0 / (1.0 + distances[i])
-                        
-                        hit = SearchHit(
-                            score=score,
-                            id=chunk.id,
-                            text=chunk.text,
-                            meta=chunk.meta.__dict__,
-                        )
-                        hits.append(hit)
-                
-                # Sort by score (descending)
-                hits.sort(key=lambda x: x.score, reverse=True)
-                
-                # Update statistics
-                self.stats.total_searches += 1
-                self.stats.avg_search_ms = (
-                    (self.stats.avg_search_ms * (self.stats.total_searches - 1) + search_timer.elapsed * 1000) /
-                    self.stats.total_searches
-                )
-                
-                retriever_logger.debug(f"Search returned {len(hits)} hits in {search_timer.elapsed * 1000:.2f}ms")
-                
-                return hits[:top_k]
-                
+                hits = self._search_batch([query], top_k, filter_meta, ef_search)[0]
+            
+            # Update statistics
+            self.stats.total_searches += 1
+            self.stats.avg_search_ms = (
+                (self.stats.avg_search_ms * (self.stats.total_searches - 1) + search_timer.elapsed * 1000) /
+                self.stats.total_searches
+            )
+            
+            retriever_logger.debug(f"Search returned {len(hits)} hits in {search_timer.elapsed * 1000:.2f}ms")
+            
+            return hits
+            
         except Exception as e:
             raise EmbeddingError(f"Search failed: {e}", self.embedding_backend.model_name)
     
@@ -211,79 +257,205 @@ class MemPackRetriever:
         filter_meta: Optional[Dict[str, Any]] = None,
         ef_search: Optional[int] = None,
         show_progress: bool = False,
-    ) -> List[List[SearchHit]]:
+        columnar: bool = False,
+    ) -> Union[List[List[SearchHit]], List[SearchResults]]:
         """Search for multiple queries.
         
+        Each batch of queries is embedded in a single forward pass and
+        searched with one multi-threaded HNSW query.
+        
         Args:
             queries: List of search queries
             top_k: Number of results per query
             filter_meta: Optional metadata filter
             ef_search: HNSW search parameter
             show_progress: Whether to show progress bar
+            columnar: Return SearchResults instead of search hit lists
             
         Returns:
-            List of search hit lists (one per query)
+            List of search hit lists, or of SearchResults (one per query)
+            
+        Raises:
+            ValidationError: If parameters are invalid
         """
         if not queries:
             return []
         
+        if top_k <= 0:
+            raise ValidationError("top_k must be positive", "top_k")
+        
         results = []
         
         # Process queries in batches
         batch_size = self.io_batch_size
-        for i in range(0, len(queries), batch_size):
+        batch_starts = range(0, len(queries), batch_size)
+        for i in tqdm(batch_starts, desc="Searching", disable=not show_progress):
             batch_queries = queries[i:i + batch_size]
             
-            # Generate embeddings for batch
             try:
-                embedding_result = self.embedding_backend.encode(
-                    texts=batch_queries,
-                    batch_size=len(batch_queries),
-                    show_progress=False,
-                )
-                
-                # Search HNSW index
-                distances, chunk_ids = self.hnsw_index.search_batch(
-                    query_vectors=embedding_result.embeddings,
-                    k=min(top_k, len(self.hnsw_index)),
-                    ef_search=ef_search or self.ef_search,
-                )
-                
-                # Process results
-                for j, query in enumerate(batch_queries):
-                    query_hits = []
-                    
-                    for k in range(len(chunk_ids[j])):
-                        chunk_id = chunk_ids[j][k]
-                        chunk = self.pack_reader.get_chunk(chunk_id)
-                        
-                        if chunk is not None:
-                            # Apply metadata filter
-                            if filter_meta and not self._matches_meta_filter(chunk.meta.__dict__, filter_meta):
-                                continue
-                            
-                            # Convert distance to similarity score
-                            score = 1.0 / (1.0 + distances[j][k])
-                            
-                            hit = SearchHit(
-                                score=score,
-                                id=chunk.id,
-                                text=chunk.text,
-                                meta=chunk.meta.__dict__,
-                            )
-                            query_hits.append(hit)
-                    
-                    # Sort by score
-                    query_hits.sort(key=lambda x: x.score, reverse=True)
-                    results.append(query_hits[:top_k])
-                
+                results.extend(self._search_batch(batch_queries, top_k, filter_meta, ef_search))
             except Exception as e:
                 retriever_logger.warning(f"Batch search failed for queries {i}-{i+len(batch_queries)-1}: {e}")
                 # Add empty results for failed batch
-                results.extend([[] for _ in batch_queries])
+                results.extend([SearchResults.empty() for _ in batch_queries])
+        
+        if columnar:
+            return results
+        
+        return [result.to_hits() for result in results]
+    
+    def _search_batch(
+        self,
+        queries: List[str],
+        top_k: int,
+        filter_meta: Optional[Dict[str, Any]],
+        ef_search: Optional[int],
+    ) -> List[SearchResults]:
+        """Embed and search a batch of queries.
+        
+        Args:
+            queries: Search queries (blank queries get no hits)
+            top_k: Number of results per query
+            filter_meta: Optional metadata filter
+            ef_search: HNSW search parameter
+            
+        Returns:
+            Search results (one per query)
+        """
+        results = [SearchResults.empty() for _ in queries]
+        active = [i for i, query in enumerate(queries) if query.strip()]
+        if not active:
+            return results
+        
+        # Generate embeddings for the whole batch
+        query_embeddings = self._embed_queries([queries[i] for i in active])
+        
+        # Search HNSW index
+        distances, chunk_ids = self.hnsw_index.search_batch(
+            query_vectors=query_embeddings,
+            k=min(top_k, len(self.hnsw_index)),
+            ef_search=ef_search or self.ef_search,
+        )
+        
+        for row, i in enumerate(active):
+            results[i] = self._build_results(distances[row], chunk_ids[row], top_k, filter_meta)
         
         return results
     
+    def _build_results(
+        self,
+        distances: np.ndarray,
+        chunk_ids: np.ndarray,
+        top_k: int,
+        filter_meta: Optional[Dict[str, Any]],
+    ) -> SearchResults:
+        """Turn index results for one query into columnar search results.
+        
+        Args:
+            distances: Distances returned by the index
+            chunk_ids: Chunk IDs returned by the index
+            top_k: Number of results to return
+            filter_meta: Optional metadata filter
+            
+        Returns:
+            Search results sorted by score (descending)
+        """
+        # Apply metadata filter before fetching any chunk text
+        if filter_meta:
+            keep = self._get_meta_index().match(chunk_ids, filter_meta)
+            distances, chunk_ids = distances[keep], chunk_ids[keep]
+        
+        # Convert distances to similarity scores (higher is better) and sort descending
+        scores = (1.0 / (1.0 + distances)).astype(np.float32)
+        order = np.argsort(-scores, kind="stable")
+        scores, chunk_ids = scores[order], chunk_ids[order].astype(np.int64)
+        
+        found = np.zeros(len(chunk_ids), dtype=bool)
+        texts = []
+        metas = []
+        for row, chunk_id in enumerate(chunk_ids.tolist()):
+            if len(texts) == top_k:
+                break
+            
+            chunk = self.pack_reader.get_chunk(chunk_id)
+            if chunk is None:
+                continue
+            
+            found[row] = True
+            texts.append(chunk.text)
+            metas.append(chunk.meta.__dict__)
+        
+        return SearchResults(
+            ids=chunk_ids[found],
+            scores=scores[found],
+            texts=texts,
+            metas=metas,
+        )
+    
+    def _get_meta_index(self) -> MetadataIndex:
+        """Get the encoded chunk metadata, building it on first use.
+        
+        Returns:
+            Metadata index
+        """
+        if self._meta_index is None:
+            self._meta_index = MetadataIndex(self.pack_reader._toc.chunks)
+        return self._meta_index
+    
+    def _embed_queries(self, queries: List[str]) -> np.ndarray:
+        """Embed queries, reusing cached embeddings where possible.
+        
+        Only the queries missing from the cache are sent to the embedding
+        backend, in a single batch.
+        
+        Args:
+            queries: Queries to embed
+            
+        Returns:
+            Query embeddings (shape: [n_queries, dimensions])
+        """
+        model_name = self.embedding_backend.model_name
+        keys = [(model_name, query.strip()) for query in queries]
+        embeddings: Dict[Tuple[str, str], np.ndarray] = {}
+        
+        with self._query_cache_lock:
+            for key in keys:
+                cached = self._query_cache.get(key)
+                if cached is not None:
+                    self._query_cache.move_to_end(key)
+                    embeddings[key] = cached
+        
+        misses = list(dict.fromkeys(key for key in keys if key not in embeddings))
+        self.stats.query_cache_hits += len(keys) - len(misses)
+        self.stats.query_cache_misses += len(misses)
+        
+        if misses:
+            result = self.embedding_backend.encode(
+                texts=[query for _, query in misses],
+                batch_size=len(misses),
+                show_progress=False,
+            )
+            
+            # Normalize once here so cached embeddings are ready for inner-product search
+            query_embeddings = normalize_vectors(result.embeddings)
+            
+            with self._query_cache_lock:
+                for key, embedding in zip(misses, query_embeddings, strict=True):
+                    embeddings[key] = embedding
+                    if self.query_cache_size > 0:
+                        self._query_cache[key] = embedding
+                        self._query_cache.move_to_end(key)
+                
+                while len(self._query_cache) > self.query_cache_size:
+                    self._query_cache.popitem(last=False)
+        
+        return np.stack([embeddings[key] for key in keys])
+    
+    def clear_query_cache(self) -> None:
+        """Clear the query embedding cache."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+    
     def get_chunk_by_id(self, chunk_id: int) -> Optional[Dict[str, Any]]:
         """Get a chunk by ID.
         
@@ -350,52 +522,14 @@ class MemPackRetriever:
             for chunk in chunks
         ]
     
-    def _filter_chunks_by_meta(
-        self,
-        chunks: List[Any],
-        meta_filter: Dict[str, Any],
-    ) -> List[Any]:
-        """Filter chunks by metadata.
-        
-        Args:
-            chunks: List of chunks
-            meta_filter: Metadata filter
-            
-        Returns:
-            Filtered chunks
-        """
-        if not meta_filter:
-            return chunks
-        
-        filtered = []
-        for chunk in chunks:
-            if chunk and self._matches_meta_filter(chunk.meta.__dict__, meta_filter):
-                filtered.append(chunk)
-        
-        return filtered
-    
-    def _matches_meta_filter(self, meta: Dict[str, Any], filter_dict: Dict[str, Any]) -> bool:
-        """Check if metadata matches filter.
-        
-        Args:
-            meta: Chunk metadata
-            filter_dict: Filter criteria
-            
-        Returns:
-            True if metadata matches filter
-        """
-        for key, value in filter_dict.items():
-            if key not in meta:
-                return False
-            if meta[key] != value:
-                return False
-        return True
-    
     def verify(self) -> bool:
         """Verify the integrity of the knowledge pack.
         
         Returns:
             True if pack is valid
+            
+        Raises:
+            ValidationError: If the pack's checksums cannot be computed here
         """
         try:
             # Verify pack file
@@ -410,6 +544,8 @@ class MemPackRetriever:
             
             return True
             
+        except ValidationError:
+            raise
         except Exception:
             return False
     
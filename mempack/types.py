@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import numpy as np
 
@@ -26,6 +26,60 @@ class SearchHit:
     """Metadata associated with the chunk."""
 
 
+@dataclass
+class SearchResults:
+    """Search results for one query in columnar form, sorted by score.
+    
+    Indexing or iterating yields SearchHit objects, which are only created
+    on access; vectorized callers can use the columns directly.
+    """
+    
+    ids: np.ndarray
+    """Chunk IDs (int64)."""
+    
+    scores: np.ndarray
+    """Similarity scores (float32, higher is more similar)."""
+    
+    texts: List[str]
+    """Text content of each chunk."""
+    
+    metas: List[Dict[str, Any]]
+    """Metadata of each chunk."""
+    
+    @classmethod
+    def empty(cls) -> SearchResults:
+        """Create results with no hits."""
+        return cls(
+            ids=np.empty(0, dtype=np.int64),
+            scores=np.empty(0, dtype=np.float32),
+            texts=[],
+            metas=[],
+        )
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def __getitem__(self, index: int) -> SearchHit:
+        return SearchHit(
+            score=float(self.scores[index]),
+            id=int(self.ids[index]),
+            text=self.texts[index],
+            meta=self.metas[index],
+        )
+    
+    def __iter__(self) -> Iterator[SearchHit]:
+        for i in range(len(self)):
+            yield self[i]
+    
+    def to_hits(self) -> List[SearchHit]:
+        """Convert to a list of search hits.
+        
+        Returns:
+            Search hits sorted by score (descending)
+        """
+        return list(self)
+
+
 @dataclass
 class ChunkMeta:
     """Metadata for a text chunk."""
@@ -87,6 +141,15 @@ class RetrieverStats:
     
     avg_search_ms: float = 0.0
     """Average search time in milliseconds."""
+    
+    query_cache_hits: int = 0
+    """Number of queries served from the query embedding cache."""
+    
+    query_cache_misses: int = 0
+    """Number of queries that had to be embedded."""
+    
+    hash_backend: str = ""
+    """Implementation behind XXH3 checksums (xxhash, blake2b)."""
 
 
 @dataclass
@@ -96,8 +159,8 @@ class Chunk:
     id: int
     """Unique chunk identifier."""
     
-    text: str
-    """The text content."""
+    text: Union[str, bytes]
+    """The text content (str, or UTF-8 encoded bytes, which are written as is)."""
     
     meta: ChunkMeta
     """Chunk metadata."""
@@ -132,7 +195,7 @@ class BlockInfo:
     """ID of last chunk in this block."""
     
     checksum: int
-    """XXH3 checksum of uncompressed data."""
+    """Checksum of uncompressed data (algorithm recorded in the pack config)."""
     
     offset: int
     """Offset in the pack file."""
@@ -148,6 +211,9 @@ class PackConfig:
     compressor: str = "zstd"
     """Compression algorithm (zstd, deflate, none)."""
     
+    checksum_algorithm: str = "xxh3"
+    """Block checksum algorithm (xxh3, crc32, crc32c)."""
+    
     chunk_size: int = 300
     """Target chunk size in characters."""
     
@@ -160,12 +226,24 @@ class PackConfig:
     embedding_dim: int = 384
     """Embedding vector dimension."""
     
+    embedding_backend: str = "torch"
+    """Inference runtime used for embeddings (torch, onnx, onnx-int8)."""
+    
+    embedding_precision: str = "fp32"
+    """Matmul precision used for embeddings (fp32, bf16)."""
+    
     index_type: str = "hnsw"
     """Index type (hnsw, ivfpq)."""
     
     index_params: Dict[str, Any] = field(default_factory=dict)
     """Index-specific parameters."""
     
+    index_quantization: str = "none"
+    """Vector quantization (none, int8, binary, pq)."""
+    
+    normalized: bool = False
+    """Whether stored embeddings are L2-normalized."""
+    
     ecc_enabled: bool = False
     """Whether error correction is enabled."""
     
@@ -1,21 +1,31 @@
 """Utility modules for MemPack."""
 
-from .io import atomic_write, pread, mmap_file, align_offset
-from .hash import compute_xxh3, compute_crc32, verify_checksum
+from .io import atomic_write, atomic_writev, pread, mmap_file, align_offset
+from .hash import compute_xxh3, new_xxh3, hash_chunks, compute_crc32, compute_crc32_update, compute_crc32c, compute_block_checksum, verify_checksum, verify_checksums_batch, hash_blocks_parallel, hash_file
 from .time import Timer, time_ms
-from .text import chunk_text, count_tokens, normalize_text
+from .text import chunk_text, chunk_text_bytes, count_tokens, normalize_text
 
 __all__ = [
     "atomic_write",
+    "atomic_writev",
     "pread", 
     "mmap_file",
     "align_offset",
     "compute_xxh3",
+    "new_xxh3",
+    "hash_chunks",
     "compute_crc32",
+    "compute_crc32_update",
+    "compute_crc32c",
+    "compute_block_checksum",
     "verify_checksum",
+    "verify_checksums_batch",
+    "hash_blocks_parallel",
+    "hash_file",
     "Timer",
     "time_ms",
     "chunk_text",
+    "chunk_text_bytes",
     "count_tokens",
     "normalize_text",
 ]
@@ -0,0 +1,79 @@
+"""Numba-compiled chunk boundary scanner (requires the optional numba package)."""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+# Code point of the only whitespace left in normalized text
+SPACE = 32
+
+
+@njit(cache=True)
+def _is_ending(code: int, endings: np.ndarray) -> bool:
+    for ending in endings:
+        if code == ending:
+            return True
+    return False
+
+
+@njit(cache=True)
+def scan_chunk_spans(
+    codes: np.ndarray,
+    endings: np.ndarray,
+    chunk_size: int,
+    chunk_overlap: int,
+    min_chunk_size: int,
+    min_split: int,
+) -> np.ndarray:
+    """Compute sentence-aware chunk spans over normalized text.
+    
+    Walks the same start/end sequence as the Python loop in chunk_text: each
+    window is cut after its last sentence ending that is followed by a space
+    and lies past min_split, unless it already ends on a sentence ending.
+    
+    Args:
+        codes: Code points of the normalized text (uint32)
+        endings: Code points of the sentence ending characters (uint32)
+        chunk_size: Target chunk size in characters
+        chunk_overlap: Overlap between chunks
+        min_chunk_size: Minimum chunk size to keep
+        min_split: Smallest offset into a window at which it may be cut
+        
+    Returns:
+        Array of shape (n, 2) holding the [start, end) offset of each chunk
+    """
+    n = codes.shape[0]
+    spans = np.empty((n // (chunk_size - chunk_overlap) + 2, 2), dtype=np.int64)
+    count = 0
+    start = 0
+    
+    while start < n:
+        end = start + chunk_size
+        last = end >= n
+        
+        if last:
+            end = n
+        elif not _is_ending(codes[end - 1], endings):
+            # Walk back to the last sentence ending followed by a space
+            for i in range(end - 2, start + min_split - 1, -1):
+                if codes[i + 1] == SPACE and _is_ending(codes[i], endings):
+                    end = i + 1
+                    break
+        
+        if end - start >= min_chunk_size:
+            if count == spans.shape[0]:
+                grown = np.empty((2 * count, 2), dtype=np.int64)
+                grown[:count] = spans
+                spans = grown
+            spans[count, 0] = start
+            spans[count, 1] = end
+            count += 1
+        
+        if last:
+            break
+        
+        # Move start position with overlap
+        start = end - chunk_overlap
+    
+    return spans[:count]
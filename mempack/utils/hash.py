@@ -3,36 +3,221 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import os
 import struct
-from typing import Union
-
-import xxhash
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
 from ..errors import ValidationError
+from ..logging import get_logger
+
+hash_logger = get_logger("hash")
+
+# The xxhash C extension picks its SSE2/AVX2/AVX-512/NEON kernel at runtime. Where
+# it is unavailable, XXH3 is replaced by an 8-byte BLAKE2b from hashlib (native
+# code as well). The two produce different values, so checksums written under one
+# backend do not verify under the other.
+try:
+    import xxhash
+    XXH3_BACKEND = "xxhash"
+except ImportError:
+    xxhash = None
+    XXH3_BACKEND = "blake2b"
+
+# zlib-ng folds CRC32 with carry-less multiplies (PCLMULQDQ/VPCLMULQDQ, PMULL);
+# the stdlib zlib is the fallback. The implementation is chosen once at import.
+try:
+    from zlib_ng import zlib_ng as _zlib
+    CRC32_BACKEND = "zlib-ng"
+except ImportError:
+    import zlib as _zlib
+    CRC32_BACKEND = "zlib"
+
+_crc32 = _zlib.crc32
+
+# CRC32C (Castagnoli) runs on the SSE4.2 crc32 instruction (ARMv8 crc32c) through
+# the optional crc32c package; it is only needed for packs that select it.
+try:
+    import crc32c as _crc32c
+except ImportError:
+    _crc32c = None
+
+hash_logger.info("xxh3 backend: %s, crc32 backend: %s", XXH3_BACKEND, CRC32_BACKEND)
+
+# Bytes each thread must get before hash_blocks_parallel uses the pool; below
+# this, handing work to a thread costs about as much as hashing it
+PARALLEL_HASH_MIN_BYTES = 4 << 20
+
+# Thread pool shared by every hash_blocks_parallel call, created on first use
+_hash_executor: Optional[ThreadPoolExecutor] = None
+_hash_executor_lock = threading.Lock()
+
+
+def _require_contiguous(data: Union[bytes, bytearray, memoryview]) -> None:
+    """Reject strided views, which the hashers cannot read in place.
+    
+    Raises:
+        ValidationError: If data is a non-contiguous memoryview
+    """
+    if type(data) is memoryview and not data.c_contiguous:
+        raise ValidationError("Cannot hash a non-contiguous memoryview", "data")
+
+
+class _Blake2bHasher:
+    """Incremental stand-in for xxhash.xxh3_64 built on BLAKE2b."""
+    
+    def __init__(self, seed: int = 0) -> None:
+        self._hasher = hashlib.blake2b(digest_size=8, salt=seed.to_bytes(16, 'little'))
+    
+    def update(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        self._hasher.update(data)
+    
+    def intdigest(self) -> int:
+        return int.from_bytes(self._hasher.digest(), 'little')
+
 
+def _blake2b_intdigest(data: Union[bytes, bytearray, memoryview], seed: int = 0) -> int:
+    hasher = _Blake2bHasher(seed)
+    hasher.update(data)
+    return hasher.intdigest()
 
-def compute_xxh3(data: Union[bytes, bytearray, memoryview]) -> int:
+
+if xxhash is not None:
+    _xxh3 = xxhash.xxh3_64_intdigest
+    _xxh3_hasher = xxhash.xxh3_64
+else:
+    _xxh3 = _blake2b_intdigest
+    _xxh3_hasher = _Blake2bHasher
+
+
+def compute_xxh3(data: Union[bytes, bytearray, memoryview], seed: int = 0) -> int:
     """Compute XXH3 hash of data.
     
+    Hashes in one call, without creating a hasher object. Any contiguous
+    buffer is hashed in place.
+    
     Args:
         data: Data to hash
+        seed: Hash seed
         
     Returns:
         64-bit hash value
+    
+    Raises:
+        ValidationError: If data is a non-contiguous memoryview
+    """
+    _require_contiguous(data)
+    return _xxh3(data, seed)
+
+
+# Implementation in use ("xxhash" or "blake2b"), for diagnostics
+compute_xxh3.backend = XXH3_BACKEND
+
+
+def new_xxh3(seed: int = 0) -> Union[xxhash.xxh3_64, _Blake2bHasher]:
+    """Create an incremental XXH3 hasher.
+    
+    Feeding data with ``update()`` gives the same ``intdigest()`` as
+    compute_xxh3 over the concatenated data.
+    
+    Args:
+        seed: Hash seed
+        
+    Returns:
+        XXH3 hasher
     """
-    return xxhash.xxh3_64(data).intdigest()
+    return _xxh3_hasher(seed=seed)
+
+
+def hash_chunks(chunks: Iterable[Union[bytes, bytearray, memoryview]], seed: int = 0) -> int:
+    """Compute one XXH3 hash over a sequence of chunks.
+    
+    Each chunk is framed by its 4-byte little-endian length and fed to a
+    single streaming hasher, so the hash state is set up and finalized once
+    for the whole batch, and moving bytes between chunks changes the hash.
+    
+    Args:
+        chunks: Chunks to hash, in order
+        seed: Hash seed
+        
+    Returns:
+        64-bit hash value
+    
+    Raises:
+        ValidationError: If a chunk is a non-contiguous memoryview
+    """
+    hasher = new_xxh3(seed)
+    for chunk in chunks:
+        _require_contiguous(chunk)
+        hasher.update(len(chunk).to_bytes(4, 'little'))
+        hasher.update(chunk)
+    return hasher.intdigest()
 
 
 def compute_crc32(data: Union[bytes, bytearray, memoryview]) -> int:
     """Compute CRC32 hash of data.
     
+    Any contiguous buffer is hashed in place.
+    
     Args:
         data: Data to hash
         
     Returns:
         32-bit CRC32 value
+    
+    Raises:
+        ValidationError: If data is a non-contiguous memoryview
     """
-    return xxhash.xxh32(data).intdigest()
+    _require_contiguous(data)
+    return _crc32(data)
+
+
+def compute_crc32_update(crc: int, data: Union[bytes, bytearray, memoryview]) -> int:
+    """Extend a running CRC32 with more data.
+    
+    Args:
+        crc: CRC32 of the preceding data (0 to start)
+        data: Data to append
+        
+    Returns:
+        32-bit CRC32 of the preceding data followed by this data
+    
+    Raises:
+        ValidationError: If data is a non-contiguous memoryview
+    """
+    _require_contiguous(data)
+    return _crc32(data, crc)
+
+
+def compute_crc32c(data: Union[bytes, bytearray, memoryview]) -> int:
+    """Compute CRC32C (Castagnoli) hash of data.
+    
+    Args:
+        data: Data to hash
+        
+    Returns:
+        32-bit CRC32C value
+    
+    Raises:
+        ValidationError: If the crc32c package is not installed, or data is
+            a non-contiguous memoryview
+    """
+    _require_crc32c()
+    _require_contiguous(data)
+    return _crc32c.crc32c(data)
+
+
+def _require_crc32c() -> None:
+    """Reject CRC32C hashing when the crc32c package is missing.
+    
+    Raises:
+        ValidationError: If the crc32c package is not installed
+    """
+    if _crc32c is None:
+        raise ValidationError("crc32c package not available for CRC32C checksums", "algorithm")
 
 
 def compute_sha256(data: Union[bytes, bytearray, memoryview]) -> bytes:
@@ -47,6 +232,31 @@ def compute_sha256(data: Union[bytes, bytearray, memoryview]) -> bytes:
     return hashlib.sha256(data).digest()
 
 
+def _compute_sha256_prefix(data: Union[bytes, bytearray, memoryview]) -> int:
+    return int.from_bytes(compute_sha256(data)[:8], byteorder='big')
+
+
+# Integer checksum function for each supported algorithm
+_CHECKSUM_FNS = {
+    "xxh3": compute_xxh3,
+    "crc32": compute_crc32,
+    "crc32c": compute_crc32c,
+    "sha256": _compute_sha256_prefix,
+}
+
+
+def _get_checksum_fn(algorithm: str):
+    """Look up the checksum function for an algorithm.
+    
+    Raises:
+        ValidationError: If algorithm is unsupported
+    """
+    try:
+        return _CHECKSUM_FNS[algorithm]
+    except KeyError:
+        raise ValidationError(f"Unsupported hash algorithm: {algorithm}", "algorithm") from None
+
+
 def verify_checksum(
     data: Union[bytes, bytearray, memoryview],
     expected: int,
@@ -57,7 +267,7 @@ def verify_checksum(
     Args:
         data: Data to verify
         expected: Expected checksum value
-        algorithm: Hash algorithm ('xxh3', 'crc32', 'sha256')
+        algorithm: Hash algorithm ('xxh3', 'crc32', 'crc32c', 'sha256')
         
     Returns:
         True if checksum matches
@@ -65,16 +275,98 @@ def verify_checksum(
     Raises:
         ValidationError: If algorithm is unsupported
     """
-    if algorithm == "xxh3":
-        actual = compute_xxh3(data)
-    elif algorithm == "crc32":
-        actual = compute_crc32(data)
-    elif algorithm == "sha256":
-        actual = int.from_bytes(compute_sha256(data)[:8], byteorder='big')
-    else:
-        raise ValidationError(f"Unsupported hash algorithm: {algorithm}", "algorithm")
+    return _get_checksum_fn(algorithm)(data) == expected
+
+
+def verify_checksums_batch(
+    items: Sequence[Tuple[Union[bytes, bytearray, memoryview], int, str]],
+    max_workers: Optional[int] = None,
+) -> List[bool]:
+    """Verify many buffers against their checksums in parallel.
     
-    return actual == expected
+    The hash functions release the GIL on large buffers, so the buffers
+    are split into one contiguous run per thread and verified on the
+    shared hashing pool, with the same PARALLEL_HASH_MIN_BYTES per-thread
+    threshold as hash_blocks_parallel.
+    
+    Args:
+        items: (data, expected checksum, algorithm) triples
+        max_workers: Maximum number of threads (None = one per CPU)
+        
+    Returns:
+        Whether each checksum matches, in input order
+        
+    Raises:
+        ValidationError: If an algorithm is unsupported
+    """
+    # Resolve every algorithm up front so errors surface before any work
+    checks = [(_get_checksum_fn(algorithm), data, expected) for data, expected, algorithm in items]
+    
+    total_bytes = sum(len(data) for _, data, _ in checks)
+    workers = min(
+        max_workers or os.cpu_count() or 1,
+        len(checks),
+        total_bytes // PARALLEL_HASH_MIN_BYTES,
+    )
+    if workers <= 1:
+        return [fn(data) == expected for fn, data, expected in checks]
+    
+    run_length = -(-len(checks) // workers)
+    runs = [checks[start:start + run_length] for start in range(0, len(checks), run_length)]
+    results = _get_hash_executor().map(lambda run: [fn(data) == expected for fn, data, expected in run], runs)
+    return [match for run_matches in results for match in run_matches]
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    """Get the shared block hashing pool (one thread per CPU)."""
+    global _hash_executor
+    
+    with _hash_executor_lock:
+        if _hash_executor is None:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count(), thread_name_prefix="mempack-hash"
+            )
+        return _hash_executor
+
+
+def hash_blocks_parallel(
+    blocks: Sequence[Union[bytes, bytearray, memoryview]],
+    algorithm: str = "xxh3",
+    max_workers: Optional[int] = None,
+) -> List[int]:
+    """Compute the checksums of many blocks in parallel.
+    
+    The hash functions release the GIL on large buffers, so the blocks are
+    split into one contiguous run per thread and hashed on a shared pool.
+    Blocks are hashed serially on single-CPU hosts and when there is less
+    than PARALLEL_HASH_MIN_BYTES of data per thread.
+    
+    Args:
+        blocks: Blocks to hash
+        algorithm: Hash algorithm ('xxh3', 'crc32', 'crc32c', 'sha256')
+        max_workers: Maximum number of threads (None = one per CPU)
+        
+    Returns:
+        Checksum of each block, in input order
+        
+    Raises:
+        ValidationError: If algorithm is unsupported
+    """
+    checksum_fn = _get_checksum_fn(algorithm)
+    
+    total_bytes = sum(len(block) for block in blocks)
+    workers = min(
+        max_workers or os.cpu_count() or 1,
+        len(blocks),
+        total_bytes // PARALLEL_HASH_MIN_BYTES,
+    )
+    if workers <= 1:
+        return [checksum_fn(block) for block in blocks]
+    
+    run_length = -(-len(blocks) // workers)
+    runs = [blocks[start:start + run_length] for start in range(0, len(blocks), run_length)]
+    results = _get_hash_executor().map(lambda run: [checksum_fn(block) for block in run], runs)
+    return [checksum for run_checksums in results for checksum in run_checksums]
 
 
 def pack_checksum(checksum: int, width: int = 8) -> bytes:
@@ -135,14 +427,7 @@ def compute_block_checksum(
     Returns:
         Checksum value
     """
-    if algorithm == "xxh3":
-        return compute_xxh3(data)
-    elif algorithm == "crc32":
-        return compute_crc32(data)
-    elif algorithm == "sha256":
-        return int.from_bytes(compute_sha256(data)[:8], byteorder='big')
-    else:
-        raise ValidationError(f"Unsupported hash algorithm: {algorithm}", "algorithm")
+    return _get_checksum_fn(algorithm)(data)
 
 
 def verify_block_checksum(
@@ -164,46 +449,102 @@ def verify_block_checksum(
     return actual == expected
 
 
-def compute_file_checksum(
-    file_path: str,
+def hash_file(
+    file_path: Union[str, Path],
     algorithm: str = "xxh3",
-    chunk_size: int = 65536,
+    chunk_size: int = 1 << 20,
 ) -> int:
-    """Compute checksum of a file.
+    """Compute the checksum of a file through a read-only memory map.
+    
+    The file is hashed straight from the page cache in ``chunk_size``
+    slices, so it is never copied into Python objects and each slice is
+    still cache-resident while it is hashed.
     
     Args:
         file_path: Path to file
-        algorithm: Hash algorithm
-        chunk_size: Read chunk size
+        algorithm: Hash algorithm ('xxh3', 'crc32', 'crc32c', 'sha256')
+        chunk_size: Bytes hashed per update
         
     Returns:
-        File checksum
+        File checksum, equal to hashing the whole file contents at once
         
     Raises:
+        ValidationError: If algorithm is unsupported
         IOError: If file cannot be read
     """
-    if algorithm == "xxh3":
-        hasher = xxhash.xxh3_64()
-    elif algorithm == "crc32":
-        hasher = xxhash.xxh32()
-    elif algorithm == "sha256":
-        hasher = hashlib.sha256()
-    else:
-        raise ValidationError(f"Unsupported hash algorithm: {algorithm}", "algorithm")
+    checksum_fn = _get_checksum_fn(algorithm)
     
     try:
         with open(file_path, 'rb') as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-                hasher.update(chunk)
-        
-        if algorithm == "sha256":
-            return int.from_bytes(hasher.digest()[:8], byteorder='big')
-        else:
-            return hasher.intdigest()
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                # Empty files cannot be mapped
+                return checksum_fn(b"")
+            
+            # Ask for aggressive readahead on the single sequential pass
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_SEQUENTIAL)
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return _hash_slices(view, algorithm, chunk_size)
             
     except Exception as e:
         from ..errors import IOError
-        raise IOError(f"Failed to compute checksum of {file_path}: {e}", file_path)
+        raise IOError(f"Failed to compute checksum of {file_path}: {e}", str(file_path))
+
+
+def _hash_slices(view: memoryview, algorithm: str, chunk_size: int) -> int:
+    """Hash a buffer incrementally in fixed-size slices.
+    
+    Args:
+        view: Buffer to hash
+        algorithm: Hash algorithm ('xxh3', 'crc32', 'crc32c', 'sha256')
+        chunk_size: Bytes hashed per update
+        
+    Returns:
+        Checksum of the whole buffer
+    """
+    starts = range(0, len(view), chunk_size)
+    
+    if algorithm == "crc32":
+        crc = 0
+        for start in starts:
+            crc = compute_crc32_update(crc, view[start:start + chunk_size])
+        return crc
+    
+    if algorithm == "crc32c":
+        _require_crc32c()
+        crc = 0
+        for start in starts:
+            crc = _crc32c.crc32c(view[start:start + chunk_size], crc)
+        return crc
+    
+    hasher = new_xxh3() if algorithm == "xxh3" else hashlib.sha256()
+    for start in starts:
+        hasher.update(view[start:start + chunk_size])
+    
+    if algorithm == "sha256":
+        return int.from_bytes(hasher.digest()[:8], byteorder='big')
+    return hasher.intdigest()
+
+
+def compute_file_checksum(
+    file_path: str,
+    algorithm: str = "xxh3",
+    chunk_size: int = 65536,
+) -> int:
+    """Compute checksum of a file.
+    
+    Args:
+        file_path: Path to file
+        algorithm: Hash algorithm
+        chunk_size: Bytes hashed per update
+        
+    Returns:
+        File checksum
+        
+    Raises:
+        IOError: If file cannot be read
+    """
+    return hash_file(file_path, algorithm, chunk_size)
@@ -6,14 +6,18 @@ import mmap
 import os
 import tempfile
 from pathlib import Path
-from typing import BinaryIO, Optional, Union
+from typing import BinaryIO, Optional, Sequence, Union
 
-from ..errors import IOError
+from ..errors import IOError, ValidationError
+
+
+# Buffer types accepted by the zero-copy writers
+Buffer = Union[bytes, bytearray, memoryview]
 
 
 def atomic_write(
     file_path: Union[str, Path],
-    data: bytes,
+    data: Buffer,
     mode: str = "wb",
     temp_suffix: str = ".tmp",
 ) -> None:
@@ -22,7 +26,33 @@ def atomic_write(
     Args:
         file_path: Path to write to
         data: Data to write
-        mode: File mode
+        mode: File mode (kept for compatibility; only "wb" is supported)
+        temp_suffix: Suffix for temporary file
+        
+    Raises:
+        ValidationError: If mode is not "wb"
+        IOError: If write operation fails
+    """
+    if mode != "wb":
+        raise ValidationError(f"Unsupported write mode: {mode} (only 'wb' is supported)", "mode")
+    
+    atomic_writev(file_path, [data], temp_suffix=temp_suffix)
+
+
+def atomic_writev(
+    file_path: Union[str, Path],
+    segments: Sequence[Buffer],
+    temp_suffix: str = ".tmp",
+) -> None:
+    """Atomically write the concatenation of several buffers to a file.
+    
+    The segments are handed to the kernel with writev directly from their
+    own memory, so they are never joined into one buffer or copied through
+    Python's buffered I/O.
+    
+    Args:
+        file_path: Path to write to
+        segments: Buffers to write, in order
         temp_suffix: Suffix for temporary file
         
     Raises:
@@ -33,18 +63,21 @@ def atomic_write(
     
     try:
         # Write to temporary file
-        with open(temp_path, mode) as f:
-            f.write(data)
-            f.flush()
-            os.fsync(f.fileno())
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            _write_all(fd, segments)
+            os.fsync(fd)
+            
+            # The file is not read back, so keep it from crowding the page cache
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
         
         # Atomic rename
-        os.rename(temp_path, file_path)
+        os.replace(temp_path, file_path)
         
     except Exception as e:
-        # Clean up temporary file on error
-        if temp_path.exists():
-            temp_path.unlink()
         raise IOError(f"Failed to write {file_path}: {e}", str(file_path))
     
     finally:
@@ -53,6 +86,45 @@ def atomic_write(
             temp_path.unlink()
 
 
+def _write_all(fd: int, segments: Sequence[Buffer]) -> None:
+    """Write all segments to a file descriptor, resuming after short writes.
+    
+    Args:
+        fd: File descriptor
+        segments: Buffers to write, in order
+    """
+    views = [memoryview(segment).cast("B") for segment in segments if len(segment)]
+    
+    if not hasattr(os, "writev"):
+        for view in views:
+            while view:
+                view = view[os.write(fd, view):]
+        return
+    
+    first = 0
+    while first < len(views):
+        written = os.writev(fd, views[first:first + _IOV_MAX])
+        
+        # Skip fully written segments and trim a partially written one
+        while written and written >= len(views[first]):
+            written -= len(views[first])
+            first += 1
+        if written:
+            views[first] = views[first][written:]
+
+
+def _iov_max() -> int:
+    """Get the maximum number of buffers per writev call."""
+    try:
+        limit = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, ValueError, OSError):
+        limit = -1
+    return limit if limit > 0 else 1024
+
+
+_IOV_MAX = _iov_max()
+
+
 def pread(fd: int, size: int, offset: int) -> bytes:
     """Read data from a file descriptor at a specific offset.
     
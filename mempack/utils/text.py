@@ -3,10 +3,63 @@
 from __future__ import annotations
 
 import re
-from typing import List, Optional, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
 
 from ..errors import ChunkingError
 
+# Sentence-aware chunking of long texts runs in compiled code when numba is installed
+try:
+    from ._chunk_numba import scan_chunk_spans
+except ImportError:
+    scan_chunk_spans = None
+
+__all__ = [
+    "chunk_text",
+    "chunk_text_bytes",
+    "find_sentence_split",
+    "normalize_text",
+    "count_tokens",
+    "extract_sentences",
+    "truncate_text",
+    "clean_text",
+    "detect_language",
+    "extract_keywords",
+]
+
+# A sentence: the first non-blank character after a terminator, up to the next terminator
+_SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]*')
+
+# A sentence break: a default terminator followed by a space (text is normalized)
+_SENTENCE_END_RE = re.compile(r'[.!?](?= )')
+
+# Runs of sentence terminators, for splitting text into sentences
+_TERMINATORS_RE = re.compile(r'[.!?]+')
+
+# Control characters other than tab and line breaks
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+# Whitespace runs, collapsed by clean_text
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# ASCII words, for keyword extraction
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+# Common English words used by detect_language
+_ENGLISH_WORDS = frozenset({
+    'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
+    'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at'
+})
+
+# Smallest offset into a chunk at which it may be cut at a sentence break
+MIN_SENTENCE_SPLIT = 50
+
+# Shorter texts are chunked in Python, where they finish before a compiled call pays off
+NUMBA_MIN_TEXT_LENGTH = 4096
+
 
 def chunk_text(
     text: str,
@@ -18,6 +71,9 @@ def chunk_text(
 ) -> List[str]:
     """Split text into overlapping chunks.
     
+    The text is normalized here, in the same pass that prepares it for
+    chunking, so callers should not run normalize_text on it first.
+    
     Args:
         text: Text to chunk
         chunk_size: Target chunk size in characters
@@ -29,6 +85,83 @@ def chunk_text(
     Returns:
         List of text chunks
         
+    Raises:
+        ChunkingError: If chunking parameters are invalid
+    """
+    text, spans = _chunk_spans(
+        text, chunk_size, chunk_overlap, min_chunk_size, split_on_sentences, sentence_endings
+    )
+    return [text[start:end] for start, end in spans]
+
+
+def chunk_text_bytes(
+    text: str,
+    chunk_size: int = 300,
+    chunk_overlap: int = 50,
+    min_chunk_size: int = 50,
+    split_on_sentences: bool = True,
+    sentence_endings: Optional[List[str]] = None,
+) -> List[bytes]:
+    """Split text into overlapping UTF-8 encoded chunks.
+    
+    Chunks are those of chunk_text, but the normalized text is encoded once
+    and sliced, so the chunks need no separate encoding before they are
+    written to a pack.
+    
+    Args:
+        text: Text to chunk
+        chunk_size: Target chunk size in characters
+        chunk_overlap: Overlap between chunks
+        min_chunk_size: Minimum chunk size to keep
+        split_on_sentences: Whether to split on sentence boundaries
+        sentence_endings: Characters that indicate sentence endings
+        
+    Returns:
+        List of UTF-8 encoded text chunks
+        
+    Raises:
+        ChunkingError: If chunking parameters are invalid
+    """
+    text, spans = _chunk_spans(
+        text, chunk_size, chunk_overlap, min_chunk_size, split_on_sentences, sentence_endings
+    )
+    data = text.encode('utf-8')
+    
+    if len(data) == len(text):
+        # ASCII: byte offsets are character offsets
+        return [data[start:end] for start, end in spans]
+    
+    # Byte offset of every character, from the UTF-8 width of each code point
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    widths = 1 + (codes >= 0x80) + (codes >= 0x800) + (codes >= 0x10000)
+    offsets = np.zeros(len(codes) + 1, dtype=np.int64)
+    np.cumsum(widths, out=offsets[1:])
+    offsets = offsets.tolist()
+    
+    return [data[offsets[start]:offsets[end]] for start, end in spans]
+
+
+def _chunk_spans(
+    text: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    min_chunk_size: int,
+    split_on_sentences: bool,
+    sentence_endings: Optional[List[str]],
+) -> Tuple[str, List[Tuple[int, int]]]:
+    """Normalize text and find the character span of each chunk.
+    
+    Args:
+        text: Text to chunk
+        chunk_size: Target chunk size in characters
+        chunk_overlap: Overlap between chunks
+        min_chunk_size: Minimum chunk size to keep
+        split_on_sentences: Whether to split on sentence boundaries
+        sentence_endings: Characters that indicate sentence endings
+        
+    Returns:
+        Normalized text and the (start, end) offsets of its chunks
+        
     Raises:
         ChunkingError: If chunking parameters are invalid
     """
@@ -45,9 +178,36 @@ def chunk_text(
     text = normalize_text(text)
     
     if len(text) <= chunk_size:
-        return [text] if len(text) >= min_chunk_size else []
+        return text, [(0, len(text))] if len(text) >= min_chunk_size else []
+    
+    if not split_on_sentences:
+        # Fixed stride: every window before the tail is a full chunk
+        stride = chunk_size - chunk_overlap
+        starts = range(0, len(text) - chunk_size, stride)
+        spans = [(start, start + chunk_size) for start in starts]
+        
+        tail_start = len(starts) * stride
+        if len(text) - tail_start >= min_chunk_size:
+            spans.append((tail_start, len(text)))
+        
+        return text, spans
+    
+    ending_chars = {ending for ending in sentence_endings if len(ending) == 1}
     
-    chunks = []
+    if scan_chunk_spans is not None and len(text) >= NUMBA_MIN_TEXT_LENGTH:
+        # Scan code points, whose offsets are str offsets, in compiled code
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        endings = np.array([ord(c) for c in ending_chars], dtype=np.uint32)
+        spans = scan_chunk_spans(
+            codes, endings, chunk_size, chunk_overlap, min_chunk_size, MIN_SENTENCE_SPLIT
+        )
+        return text, spans.tolist()
+    
+    # Find every sentence break once; each chunk then looks up the last break
+    # inside its window by binary search instead of rescanning the window
+    breaks = _sentence_breaks(text, ending_chars)
+    
+    spans = []
     start = 0
     
     while start < len(text):
@@ -55,28 +215,50 @@ def chunk_text(
         
         if end >= len(text):
             # Last chunk
-            chunk = text[start:]
-            if len(chunk) >= min_chunk_size:
-                chunks.append(chunk)
+            if len(text) - start >= min_chunk_size:
+                spans.append((start, len(text)))
             break
         
-        if split_on_sentences:
-            # Try to split at sentence boundary
-            chunk = text[start:end]
-            best_split = find_sentence_split(chunk, sentence_endings)
-            if best_split > 0:
-                end = start + best_split
+        # Cut at the last sentence break in the window, if any; a window that
+        # already ends on a terminator is kept whole, as in find_sentence_split
+        if text[end - 1] not in ending_chars:
+            i = bisect_right(breaks, end - 1) - 1
+            if i >= 0 and breaks[i] > start + MIN_SENTENCE_SPLIT:
+                end = breaks[i]
         
-        chunk = text[start:end]
-        if len(chunk) >= min_chunk_size:
-            chunks.append(chunk)
+        if end - start >= min_chunk_size:
+            spans.append((start, end))
         
         # Move start position with overlap
         start = end - chunk_overlap
         if start >= len(text):
             break
     
-    return chunks
+    return text, spans
+
+
+def _sentence_breaks(text: str, ending_chars: Set[str]) -> List[int]:
+    """Find the offsets just past each sentence ending that precedes a space.
+    
+    Args:
+        text: Normalized text
+        ending_chars: Characters that indicate sentence endings
+        
+    Returns:
+        Sorted split offsets
+    """
+    endings = tuple(sorted(ending_chars))
+    if not endings:
+        return []
+    
+    pattern = _SENTENCE_END_RE if endings == ('!', '.', '?') else _sentence_end_pattern(endings)
+    return [match.end() for match in pattern.finditer(text)]
+
+
+@lru_cache(maxsize=32)
+def _sentence_end_pattern(endings: Tuple[str, ...]) -> re.Pattern:
+    """Compile the sentence break pattern for custom ending characters."""
+    return re.compile('[' + ''.join(re.escape(c) for c in endings) + '](?= )')
 
 
 def find_sentence_split(
@@ -116,16 +298,9 @@ def normalize_text(text: str) -> str:
     Returns:
         Normalized text
     """
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    
-    # Normalize line endings
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
-    
-    return text
+    # Collapse whitespace runs (line breaks included) to single spaces and
+    # strip the ends; str.split() uses the same whitespace set as re's \s
+    return ' '.join(text.split())
 
 
 def count_tokens(text: str, method: str = "char") -> int:
@@ -143,9 +318,8 @@ def count_tokens(text: str, method: str = "char") -> int:
     elif method == "word":
         return len(text.split())
     elif method == "sentence":
-        # Simple sentence counting based on punctuation
-        sentences = re.split(r'[.!?]+', text)
-        return len([s for s in sentences if s.strip()])
+        # Count non-blank runs between punctuation without building the split list
+        return sum(1 for _ in _SENTENCE_RE.finditer(text))
     else:
         raise ValueError(f"Unknown counting method: {method}")
 
@@ -160,7 +334,7 @@ def extract_sentences(text: str) -> List[str]:
         List of sentences
     """
     # Split on sentence endings
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _TERMINATORS_RE.split(text)
     
     # Clean up and filter empty sentences
     sentences = [s.strip() for s in sentences if s.strip()]
@@ -198,10 +372,10 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Remove control characters except newlines and tabs
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
+    text = _CONTROL_CHARS_RE.sub('', text)
     
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # Remove leading/trailing whitespace
     text = text.strip()
@@ -219,13 +393,8 @@ def detect_language(text: str) -> str:
         Detected language code ('en', 'unknown')
     """
     # Simple heuristic based on common English words
-    english_words = {
-        'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
-        'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at'
-    }
-    
     words = set(text.lower().split())
-    english_count = len(words.intersection(english_words))
+    english_count = len(words.intersection(_ENGLISH_WORDS))
     
     if english_count > 0:
         return 'en'
@@ -244,7 +413,7 @@ def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
         List of keywords
     """
     # Simple keyword extraction based on word frequency
-    words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+    words = _WORD_RE.findall(text.lower())
     
     # Count word frequencies
     word_counts = {}
@@ -8,18 +8,22 @@ from typing import Generator, Optional
 
 
 class Timer:
-    """A simple timer for measuring elapsed time."""
+    """A simple timer for measuring elapsed time.
+    
+    Time is accumulated as integer nanoseconds and only converted to
+    seconds when read, so repeated start/stop cycles add no rounding error.
+    """
     
     def __init__(self) -> None:
-        self._start_time: Optional[float] = None
-        self._elapsed: float = 0.0
+        self._start_ns: Optional[int] = None
+        self._elapsed_ns: int = 0
         self._running: bool = False
     
     def start(self) -> None:
         """Start the timer."""
         if self._running:
             return
-        self._start_time = time.perf_counter()
+        self._start_ns = time.perf_counter_ns()
         self._running = True
     
     def stop(self) -> float:
@@ -28,25 +32,30 @@ class Timer:
         Returns:
             Elapsed time in seconds
         """
-        if not self._running or self._start_time is None:
-            return self._elapsed
+        if not self._running or self._start_ns is None:
+            return self._elapsed_ns / 1e9
         
-        self._elapsed += time.perf_counter() - self._start_time
+        self._elapsed_ns += time.perf_counter_ns() - self._start_ns
         self._running = False
-        return self._elapsed
+        return self._elapsed_ns / 1e9
     
     def reset(self) -> None:
         """Reset the timer."""
-        self._start_time = None
-        self._elapsed = 0.0
+        self._start_ns = None
+        self._elapsed_ns = 0
         self._running = False
     
     @property
     def elapsed(self) -> float:
         """Get elapsed time in seconds."""
-        if self._running and self._start_time is not None:
-            return self._elapsed + (time.perf_counter() - self._start_time)
-        return self._elapsed
+        return self.elapsed_ns / 1e9
+    
+    @property
+    def elapsed_ns(self) -> int:
+        """Get elapsed time in nanoseconds."""
+        if self._running and self._start_ns is not None:
+            return self._elapsed_ns + (time.perf_counter_ns() - self._start_ns)
+        return self._elapsed_ns
     
     @property
     def running(self) -> bool:
@@ -3,9 +3,59 @@
 import pytest
 import tempfile
 from pathlib import Path
+from typing import List, Union
+
+import numpy as np
 
 from mempack import MemPackEncoder, MemPackRetriever
 from mempack.config import MemPackConfig
+from mempack.embedding import EmbeddingBackend
+from mempack.embedding.base import EmbeddingResult
+from mempack.errors import ValidationError
+from mempack.utils import compute_xxh3
+
+
+class HashingBackend(EmbeddingBackend):
+    """Bag-of-words embeddings from hashed words, so tests need no model download."""
+    
+    def __init__(self, dimensions: int = 384) -> None:
+        super().__init__("hashing-test")
+        self._dimensions = dimensions
+        self.encode_calls = 0
+    
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+    
+    @property
+    def model_hash(self) -> str:
+        return "hashing-test"
+    
+    def encode(
+        self,
+        texts: Union[str, List[str]],
+        batch_size: int = 32,
+        show_progress: bool = False,
+    ) -> EmbeddingResult:
+        self.encode_calls += 1
+        texts = self.validate_texts(texts)
+        
+        embeddings = np.zeros((len(texts), self._dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                embeddings[row, compute_xxh3(word.encode('utf-8')) % self._dimensions] += 1.0
+        
+        return EmbeddingResult(
+            embeddings=self.normalize_embeddings(embeddings),
+            model_name=self.model_name,
+            model_hash=self.model_hash,
+            processing_time_ms=0.0,
+            batch_size=len(texts),
+            dimensions=self._dimensions,
+        )
+    
+    def encode_single(self, text: str) -> np.ndarray:
+        return self.encode([text]).embeddings[0]
 
 
 @pytest.fixture
@@ -72,6 +122,11 @@ def test_build_and_search(temp_dir, sample_texts):
         assert all(hit.text for hit in hits)
         assert all(hit.meta for hit in hits)
         
+        # Test columnar search matches the hit list
+        results = retriever.search_columnar("artificial intelligence", top_k=3)
+        assert results.ids.tolist() == [hit.id for hit in hits]
+        assert results.texts == [hit.text for hit in hits]
+        
         # Test get_chunk_by_id
         if hits:
             chunk_id = hits[0].id
@@ -161,6 +216,13 @@ def test_metadata_filtering(temp_dir, sample_texts):
         # All hits should have topic="ML"
         for hit in hits:
             assert hit.meta.get("topic") == "ML"
+        
+        # Search by source (a top-level metadata field)
+        hits = retriever.search("intelligence", top_k=10, filter_meta={"source": "ai_intro.txt"})
+        
+        assert len(hits) > 0
+        for hit in hits:
+            assert hit.meta.get("source") == "ai_intro.txt"
 
 
 def test_batch_search(temp_dir, sample_texts):
@@ -206,3 +268,194 @@ def test_error_handling(temp_dir):
     
     with pytest.raises(Exception):  # Should raise ValidationError
         encoder.build(pack_path=pack_path, ann_path=ann_path)
+
+
+def test_query_cache(temp_dir, sample_texts):
+    """Test that repeated queries reuse cached embeddings."""
+    config = MemPackConfig()
+    config.chunking.chunk_size = 100
+    config.embedding.model = "all-MiniLM-L6-v2"
+    
+    pack_path = temp_dir / "test.mpack"
+    ann_path = temp_dir / "test.ann"
+    
+    encoder = MemPackEncoder(config=config)
+    
+    for text_data in sample_texts:
+        encoder.add_text(text_data["text"], text_data["meta"])
+    
+    encoder.build(pack_path=pack_path, ann_path=ann_path)
+    
+    with MemPackRetriever(pack_path=pack_path, ann_path=ann_path) as retriever:
+        first = retriever.search("machine learning", top_k=3)
+        second = retriever.search("machine learning", top_k=3)
+        
+        assert [hit.id for hit in first] == [hit.id for hit in second]
+        
+        stats = retriever.get_stats()
+        assert stats.query_cache_misses == 1
+        assert stats.query_cache_hits == 1
+
+
+@pytest.mark.parametrize("quantization", ["int8", "binary", "pq"])
+def test_quantization(temp_dir, sample_texts, quantization):
+    """Test building and searching a quantized index."""
+    config = MemPackConfig()
+    config.chunking.chunk_size = 100
+    config.embedding.model = "all-MiniLM-L6-v2"
+    config.index.quantization = quantization
+    
+    pack_path = temp_dir / "test.mpack"
+    ann_path = temp_dir / "test.ann"
+    
+    encoder = MemPackEncoder(config=config)
+    
+    for text_data in sample_texts:
+        encoder.add_text(text_data["text"], text_data["meta"])
+    
+    encoder.build(pack_path=pack_path, ann_path=ann_path)
+    
+    with MemPackRetriever(pack_path=pack_path, ann_path=ann_path) as retriever:
+        hits = retriever.search("artificial intelligence", top_k=2)
+        
+        assert len(hits) > 0
+        assert "Artificial intelligence" in hits[0].text
+        assert retriever.get_index_stats()["quantization"] == quantization
+        assert retriever.verify()
+
+
+def test_streaming_build(temp_dir, sample_texts):
+    """Test building from a stream of documents."""
+    config = MemPackConfig()
+    config.chunking.chunk_size = 100
+    config.embedding.model = "all-MiniLM-L6-v2"
+    
+    pack_path = temp_dir / "test.mpack"
+    ann_path = temp_dir / "test.ann"
+    
+    encoder = MemPackEncoder(config=config)
+    encoder.add_text("Reinforcement learning trains agents through rewards.")
+    
+    documents = ((text_data["text"], text_data["meta"]) for text_data in sample_texts)
+    stats = encoder.build(pack_path=pack_path, ann_path=ann_path, documents=documents)
+    
+    assert stats.chunks == len(encoder.chunks)
+    assert stats.vectors == stats.chunks
+    
+    with MemPackRetriever(pack_path=pack_path, ann_path=ann_path) as retriever:
+        hits = retriever.search("deep learning neural networks", top_k=3)
+        
+        assert len(hits) > 0
+        assert any(hit.meta.get("topic") == "DL" for hit in hits)
+
+
+@pytest.mark.parametrize("checksum", ["xxh3", "crc32", "crc32c"])
+def test_checksum_algorithms(temp_dir, sample_texts, checksum):
+    """Test that packs written with each block checksum verify on read."""
+    if checksum == "crc32c":
+        pytest.importorskip("crc32c")
+    
+    config = MemPackConfig()
+    config.chunking.chunk_size = 100
+    config.compression.checksum = checksum
+    
+    pack_path = temp_dir / "test.mpack"
+    ann_path = temp_dir / "test.ann"
+    
+    encoder = MemPackEncoder(config=config, embedding_backend=HashingBackend())
+    
+    for text_data in sample_texts:
+        encoder.add_text(text_data["text"], text_data["meta"])
+    
+    encoder.build(pack_path=pack_path, ann_path=ann_path)
+    
+    with MemPackRetriever(pack_path=pack_path, ann_path=ann_path, embedding_backend=HashingBackend()) as retriever:
+        assert retriever.pack_reader.get_config()["checksum_algorithm"] == checksum
+        assert retriever.verify()
+        assert retriever.search("machine learning", top_k=1)
+
+
+def test_checksum_backend_mismatch(temp_dir, sample_texts, monkeypatch):
+    """Test that XXH3 packs from another hash backend are rejected, not reported corrupt."""
+    import mempack.pack.reader as reader_module
+    
+    config = MemPackConfig()
+    config.chunking.chunk_size = 100
+    
+    pack_path = temp_dir / "test.mpack"
+    ann_path = temp_dir / "test.ann"
+    
+    encoder = MemPackEncoder(config=config, embedding_backend=HashingBackend())
+    
+    for text_data in sample_texts:
+        encoder.add_text(text_data["text"], text_data["meta"])
+    
+    encoder.build(pack_path=pack_path, ann_path=ann_path)
+    
+    monkeypatch.setattr(reader_module, "XXH3_BACKEND", "other")
+    
+    with MemPackRetriever(pack_path=pack_path, ann_path=ann_path, embedding_backend=HashingBackend()) as retriever:
+        with pytest.raises(ValidationError, match="XXH3 backend"):
+            retriever.verify()
+
+
+@pytest.mark.parametrize("quantization", ["int8", "binary", "pq"])
+def test_hugepages(temp_dir, sample_texts, quantization):
+    """Test that huge-page-backed quantized codes give the same results."""
+    config = MemPackConfig()
+    config.chunking.chunk_size = 100
+    config.index.quantization = quantization
+    
+    pack_path = temp_dir / "test.mpack"
+    ann_path = temp_dir / "test.ann"
+    
+    encoder = MemPackEncoder(config=config, embedding_backend=HashingBackend())
+    
+    for text_data in sample_texts:
+        encoder.add_text(text_data["text"], text_data["meta"])
+    
+    encoder.build(pack_path=pack_path, ann_path=ann_path)
+    
+    queries = ["artificial intelligence", "neural networks with layers", "learn without programming"]
+    results = {}
+    for hugepages in (False, True):
+        with MemPackRetriever(
+            pack_path=pack_path,
+            ann_path=ann_path,
+            embedding_backend=HashingBackend(),
+            hugepages=hugepages,
+        ) as retriever:
+            results[hugepages] = [
+                [(hit.id, hit.score) for hit in retriever.search(query, top_k=3)] for query in queries
+            ]
+    
+    assert results[False][0]
+    assert results[True] == results[False]
+
+
+@pytest.mark.parametrize("warmup", [True, False])
+def test_warmup(temp_dir, sample_texts, warmup):
+    """Test that warmup runs exactly one encode when the retriever opens."""
+    config = MemPackConfig()
+    config.chunking.chunk_size = 100
+    
+    pack_path = temp_dir / "test.mpack"
+    ann_path = temp_dir / "test.ann"
+    
+    encoder = MemPackEncoder(config=config, embedding_backend=HashingBackend())
+    
+    for text_data in sample_texts:
+        encoder.add_text(text_data["text"], text_data["meta"])
+    
+    encoder.build(pack_path=pack_path, ann_path=ann_path)
+    
+    backend = HashingBackend()
+    with MemPackRetriever(
+        pack_path=pack_path, ann_path=ann_path, embedding_backend=backend, warmup=warmup
+    ) as retriever:
+        assert backend.encode_calls == (1 if warmup else 0)
+        
+        # Warmup leaves the query cache and statistics untouched
+        stats = retriever.get_stats()
+        assert stats.total_searches == 0
+        assert stats.query_cache_misses == 0
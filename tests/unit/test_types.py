@@ -4,7 +4,7 @@ import pytest
 import numpy as np
 
 from mempack.types import (
-    SearchHit, ChunkMeta, BuildStats, RetrieverStats,
+    SearchHit, SearchResults, ChunkMeta, BuildStats, RetrieverStats,
     Chunk, BlockInfo, PackConfig, IndexConfig, HNSWParams
 )
 
@@ -24,6 +24,26 @@ def test_search_hit():
     assert hit.meta["source"] == "test.md"
 
 
+def test_search_results():
+    """Test SearchResults columns and lazy hits."""
+    results = SearchResults(
+        ids=np.array([3, 1], dtype=np.int64),
+        scores=np.array([0.9, 0.5], dtype=np.float32),
+        texts=["First", "Second"],
+        metas=[{"source": "a.md"}, {"source": "b.md"}]
+    )
+    
+    assert len(results) == 2
+    assert results[0].id == 3
+    assert results[0].text == "First"
+    assert results[1].meta["source"] == "b.md"
+    assert [hit.id for hit in results] == [3, 1]
+    assert results.to_hits()[0] == SearchHit(score=float(np.float32(0.9)), id=3, text="First", meta={"source": "a.md"})
+    
+    assert len(SearchResults.empty()) == 0
+    assert SearchResults.empty().to_hits() == []
+
+
 def test_chunk_meta():
     """Test ChunkMeta creation."""
     meta = ChunkMeta(
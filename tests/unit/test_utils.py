@@ -4,10 +4,13 @@ import pytest
 import tempfile
 from pathlib import Path
 
+from mempack.errors import ValidationError
 from mempack.utils import (
-    atomic_write, compute_xxh3, compute_crc32, verify_checksum,
-    chunk_text, normalize_text, count_tokens, Timer
+    atomic_write, atomic_writev, compute_xxh3, new_xxh3, hash_chunks, compute_crc32, compute_crc32_update, compute_crc32c,
+    verify_checksum, verify_checksums_batch, hash_blocks_parallel, hash_file,
+    chunk_text, chunk_text_bytes, normalize_text, count_tokens, Timer
 )
+from mempack.utils.hash import PARALLEL_HASH_MIN_BYTES
 
 
 def test_atomic_write():
@@ -25,6 +28,15 @@ def test_atomic_write():
         with open(tmp_path, 'rb') as f:
             assert f.read() == test_data
         
+        # Write several segments in one call
+        atomic_writev(tmp_path, [b"Hello", bytearray(b", "), memoryview(b"World!")])
+        with open(tmp_path, 'rb') as f:
+            assert f.read() == test_data
+        
+        # Only whole-file binary writes are supported
+        with pytest.raises(ValidationError):
+            atomic_write(tmp_path, test_data, mode="ab")
+        
     finally:
         # Cleanup
         if tmp_path.exists():
@@ -43,6 +55,42 @@ def test_compute_xxh3():
     # Different input should produce different hash
     hash3 = compute_xxh3(b"Different data")
     assert hash1 != hash3
+    
+    # Seeds change the hash, and incremental hashing matches one-shot hashing
+    assert compute_xxh3(data, seed=1) != hash1
+    hasher = new_xxh3()
+    hasher.update(data[:5])
+    hasher.update(memoryview(data)[5:])
+    assert hasher.intdigest() == hash1
+    
+    # Contiguous views hash in place
+    assert compute_xxh3(memoryview(bytearray(data))) == hash1
+    
+    # Short inputs are hashed directly, so a mutated buffer hashes its new contents
+    buf = bytearray(data)
+    assert compute_xxh3(buf) == hash1
+    buf[0] = ord("J")
+    assert compute_xxh3(buf) == compute_xxh3(b"Jello, World!")
+    
+    assert compute_xxh3.backend in ("xxhash", "blake2b")
+    
+    # Batches hash their length-framed chunks, so chunk boundaries matter
+    batch_hash = hash_chunks([b"Hello, ", b"World!"])
+    assert batch_hash == hash_chunks([b"Hello, ", memoryview(b"World!")])
+    assert batch_hash == compute_xxh3(b"\x07\x00\x00\x00Hello, \x06\x00\x00\x00World!")
+    assert batch_hash != hash_chunks([b"Hello", b", World!"])
+
+
+def test_hash_rejects_strided_view():
+    """Test that non-contiguous views are rejected instead of copied."""
+    view = memoryview(b"Hello, World!")[::2]
+    
+    with pytest.raises(ValidationError):
+        compute_xxh3(view)
+    with pytest.raises(ValidationError):
+        compute_crc32(view)
+    with pytest.raises(ValidationError):
+        hash_chunks([b"Hello", view])
 
 
 def test_compute_crc32():
@@ -57,6 +105,22 @@ def test_compute_crc32():
     # Different input should produce different hash
     hash3 = compute_crc32(b"Different data")
     assert hash1 != hash3
+    
+    # Standard CRC-32 check value
+    assert compute_crc32(b"123456789") == 0xCBF43926
+    
+    # Buffers hash like bytes, and updates chain
+    assert compute_crc32(memoryview(data)) == hash1
+    assert compute_crc32_update(compute_crc32(data[:5]), data[5:]) == hash1
+    
+    # CRC32C needs the optional crc32c package
+    try:
+        import crc32c  # noqa: F401
+    except ImportError:
+        with pytest.raises(ValidationError):
+            compute_crc32c(data)
+    else:
+        assert compute_crc32c(b"123456789") == 0xE3069283
 
 
 def test_verify_checksum():
@@ -69,6 +133,60 @@ def test_verify_checksum():
     
     # Invalid checksum should fail
     assert not verify_checksum(data, checksum + 1, "xxh3")
+    
+    # Batches keep input order
+    items = [
+        (data, checksum, "xxh3"),
+        (data, compute_crc32(data), "crc32"),
+        (data, checksum + 1, "xxh3"),
+    ]
+    assert verify_checksums_batch(items) == [True, True, False]
+    
+    # Parallel block hashing keeps the input order
+    blocks = [data * i for i in range(1, 9)]
+    assert hash_blocks_parallel(blocks) == [compute_xxh3(block) for block in blocks]
+    assert hash_blocks_parallel(blocks, "crc32", max_workers=2) == [compute_crc32(block) for block in blocks]
+
+
+def test_verify_checksum_unsupported_algorithm():
+    """Test that unknown checksum algorithms are rejected."""
+    data = b"Hello, World!"
+    
+    with pytest.raises(ValidationError):
+        verify_checksum(data, compute_xxh3(data), "md5")
+    with pytest.raises(ValidationError):
+        verify_checksums_batch([(data, compute_xxh3(data), "md5")])
+
+
+def test_hash_blocks_parallel():
+    """Test that pooled block hashing matches serial hashing."""
+    # Enough data per thread to take the pooled path
+    blocks = [bytes([i]) * (PARALLEL_HASH_MIN_BYTES // 2) for i in range(9)]
+    
+    assert hash_blocks_parallel(blocks) == [compute_xxh3(block) for block in blocks]
+    assert hash_blocks_parallel(blocks, "crc32", max_workers=3) == [compute_crc32(block) for block in blocks]
+    assert hash_blocks_parallel([]) == []
+    
+    # Batch verification takes the same pooled path
+    items = [(block, compute_xxh3(block) + (i == 4), "xxh3") for i, block in enumerate(blocks)]
+    assert verify_checksums_batch(items) == [i != 4 for i in range(len(blocks))]
+    assert verify_checksums_batch([]) == []
+
+
+def test_hash_file():
+    """Test hashing a file through a memory map."""
+    data = b"Hello, World!" * 1000
+    
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        tmp.write(data)
+        tmp_path = Path(tmp.name)
+    
+    try:
+        assert hash_file(tmp_path) == compute_xxh3(data)
+        assert hash_file(tmp_path, "crc32", chunk_size=1000) == compute_crc32(data)
+        
+    finally:
+        tmp_path.unlink()
 
 
 def test_chunk_text():
@@ -87,6 +205,55 @@ def test_chunk_text():
     
     # Check that chunks don't exceed size limit (with some tolerance)
     assert all(len(chunk) <= 40 for chunk in chunks)
+    
+    # Without sentence splitting, windows advance by a fixed stride
+    chunks = chunk_text(
+        text=text,
+        chunk_size=30,
+        chunk_overlap=10,
+        min_chunk_size=10,
+        split_on_sentences=False
+    )
+    
+    assert chunks[0] == text[:30]
+    assert chunks[1] == text[20:50]
+    assert chunks[-1] == text[60:]
+    
+    # Longer windows are cut at their last sentence break past the minimum split
+    text = "Alpha beta gamma delta. " * 10
+    chunks = chunk_text(text=text, chunk_size=100, chunk_overlap=10, min_chunk_size=10)
+    
+    assert chunks[0] == text[:95]
+    assert chunks[1] == text[85:167]
+    
+    # Encoded chunks match the text chunks, including multi-byte characters
+    text = "Ünïcödé tëxt wïth áccents, ✓ marks and émojis 😀. " * 10
+    assert chunk_text_bytes(text, chunk_size=100, chunk_overlap=10, min_chunk_size=10) == [
+        chunk.encode('utf-8')
+        for chunk in chunk_text(text, chunk_size=100, chunk_overlap=10, min_chunk_size=10)
+    ]
+
+
+def test_chunk_text_numba_scanner(monkeypatch):
+    """Test that the compiled chunk scanner matches the Python chunker."""
+    pytest.importorskip("numba")
+    import mempack.utils.text as text_module
+    
+    text = (
+        "Ünïcödé tëxt wïth áccents! Ελληνικά κείμενα εδώ. 日本語の文章です。 "
+        "Short one? Emojis 😀 and ✓ marks follow.   Then   more\n\nwords here. "
+    ) * 60
+    assert len(normalize_text(text)) >= text_module.NUMBA_MIN_TEXT_LENGTH
+    
+    cases = [
+        {"chunk_size": 300, "chunk_overlap": 50, "min_chunk_size": 50},
+        {"chunk_size": 120, "chunk_overlap": 30, "min_chunk_size": 10},
+        {"chunk_size": 200, "chunk_overlap": 20, "min_chunk_size": 20, "sentence_endings": ["。", "!"]},
+    ]
+    compiled = [chunk_text(text, **kwargs) for kwargs in cases]
+    
+    monkeypatch.setattr(text_module, "scan_chunk_spans", None)
+    assert [chunk_text(text, **kwargs) for kwargs in cases] == compiled
 
 
 def test_normalize_text():
@@ -138,6 +305,7 @@ def test_timer():
     assert not timer.running
     assert elapsed >= 0.0
     assert timer.elapsed == elapsed
+    assert timer.elapsed_ns == round(elapsed * 1e9)
     
     # Reset timer
     timer.reset()